@@ -8,7 +8,7 @@ from typing import List, Optional
 from .models import Component, ComponentRequirements
 
 
-@dataclass
+@dataclass(frozen=True)
 class PrioritizationWeights:
     """Weights for multi-criteria component prioritization."""
     
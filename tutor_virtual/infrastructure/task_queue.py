@@ -4,7 +4,7 @@ import json
 import logging
 import os
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional
 from uuid import uuid4
 
 try:
@@ -55,22 +55,40 @@ class RedisTaskQueue:
         Returns:
             job_id: Unique identifier for the job
         """
-        job_id = str(uuid4())
-        job_data = {
-            "job_id": job_id,
-            "type": task_type,
-            "payload": payload,
-            "created_at": time.time()
-        }
+        return self.enqueue_jobs(task_type, [payload])[0]
+
+    def enqueue_jobs(self, task_type: str, payloads: Iterable[Dict[str, Any]]) -> List[str]:
+        """
+        Add several jobs to the queue in a single Redis round-trip.
         
-        # Set initial status
-        self.set_job_status(job_id, "queued", {"progress": 0})
+        Args:
+            task_type: Type of task (e.g., 'index_document')
+            payloads: Data required for each task
+            
+        Returns:
+            job_ids: Identifiers in the same order as the payloads
+        """
+        job_ids = []
+        now = time.time()
+        pipe = self.redis.pipeline(transaction=False)
+        for payload in payloads:
+            job_id = str(uuid4())
+            job_data = {
+                "job_id": job_id,
+                "type": task_type,
+                "payload": payload,
+                "created_at": now
+            }
+            # Set initial status, then push to queue
+            pipe.set(f"{self.STATUS_KEY_PREFIX}{job_id}", self._status_json("queued", {"progress": 0}), ex=86400)
+            pipe.rpush(self.QUEUE_KEY, json.dumps(job_data))
+            job_ids.append(job_id)
         
-        # Push to queue
-        self.redis.rpush(self.QUEUE_KEY, json.dumps(job_data))
-        logger.info(f"Enqueued job {job_id} of type {task_type}")
+        if job_ids:
+            pipe.execute()
+            logger.info(f"Enqueued {len(job_ids)} job(s) of type {task_type}")
         
-        return job_id
+        return job_ids
     
     def pop_job(self, timeout: int = 0) -> Optional[Dict[str, Any]]:
         """
@@ -87,16 +105,29 @@ class RedisTaskQueue:
             return json.loads(result[1])
         return None
         
-    def set_job_status(self, job_id: str, status: str, metadata: Optional[Dict] = None):
-        """Update job status and metadata."""
-        data = {
+    @staticmethod
+    def _status_json(status: str, metadata: Optional[Dict] = None) -> str:
+        return json.dumps({
             "status": status,
             "updated_at": time.time(),
             **(metadata or {})
-        }
+        })
+
+    def set_job_status(self, job_id: str, status: str, metadata: Optional[Dict] = None):
+        """Update job status and metadata."""
         key = f"{self.STATUS_KEY_PREFIX}{job_id}"
-        self.redis.set(key, json.dumps(data), ex=86400)  # Expire after 24h
+        self.redis.set(key, self._status_json(status, metadata), ex=86400)  # Expire after 24h
         
+    def get_job_statuses(self, job_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get several job statuses with a single MGET."""
+        if not job_ids:
+            return {}
+        values = self.redis.mget([f"{self.STATUS_KEY_PREFIX}{job_id}" for job_id in job_ids])
+        return {
+            job_id: json.loads(data) if data else {"status": "unknown"}
+            for job_id, data in zip(job_ids, values)
+        }
+
     def get_job_status(self, job_id: str) -> Dict[str, Any]:
         """Get current job status."""
         key = f"{self.STATUS_KEY_PREFIX}{job_id}"
@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import math
+import sys
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, Optional, List
+from itertools import chain
+from typing import Callable, Dict, List, Mapping, Optional
 from pathlib import Path
+from types import MappingProxyType
 import os
 
 from textual import events
@@ -14,15 +20,24 @@ from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, VerticalScroll
 from textual.message import Message
 from textual.reactive import reactive
-from textual.widgets import Button, Footer, Header, Input, Label, Markdown, Select
+from textual.widgets import Button, Footer, Header, Input, Label, LoadingIndicator, Markdown, RichLog, Select
+from rich.style import Style
+from rich.text import Text
 
 from tutor_virtual.application.services.design_workflow import DesignWorkflowService, ValidationFailedError
-from tutor_virtual.application.services.component_recommendation import ComponentRecommendationService
 from tutor_virtual.domain.converters import ConverterFactory, TopologyId, register_default_designers
 from tutor_virtual.domain.validation import ValidationEngine, register_default_rules
-from tutor_virtual.domain.components import ComponentRequirements, ComponentType, Component, PrioritizationWeights
+from tutor_virtual.domain.components import (
+    Capacitor,
+    Component,
+    ComponentRequirements,
+    ComponentType,
+    Diode,
+    Inductor,
+    MOSFET,
+    PrioritizationWeights,
+)
 from tutor_virtual.domain.components.selector import ComponentSelector
-from tutor_virtual.infrastructure.catalogs.mouser import MouserAdapter
 from tutor_virtual.shared.dto import ConverterSpec, DesignContext, DesignRequest, DesignSessionResult
 
 from .spec_schema import FieldDefinition, TopologyForm, available_forms
@@ -48,9 +63,12 @@ logging.getLogger('markdown_it').setLevel(logging.WARNING)
 
 logger = logging.getLogger(__name__)
 
+# Intervalo (s) con el que se vuelcan los textos pendientes a los widgets (~30 fps)
+UI_FLUSH_INTERVAL = 0.033
+
 
-# Mapeo de variables de salida a sus unidades
-OUTPUT_UNITS = {
+# Mapeo de variables de salida a sus unidades (inmutable, claves internadas)
+_OUTPUT_UNITS = {
     # Voltajes
     "vo_avg": "V",
     "vo_rms": "V",
@@ -124,44 +142,235 @@ OUTPUT_UNITS = {
     "ripple_factor": "",
     "rectification_efficiency": "%",
 }
+OUTPUT_UNITS = MappingProxyType({sys.intern(k): sys.intern(v) for k, v in _OUTPUT_UNITS.items()})
+del _OUTPUT_UNITS
+
+
+# Tipos de componente requeridos por cada topología
+_TOPOLOGY_COMPONENTS: Dict[TopologyId, tuple[ComponentType, ...]] = {
+    TopologyId.DC_DC_BUCK: (ComponentType.MOSFET, ComponentType.DIODE, ComponentType.INDUCTOR, ComponentType.CAPACITOR),
+    TopologyId.DC_DC_BOOST: (ComponentType.MOSFET, ComponentType.DIODE, ComponentType.INDUCTOR, ComponentType.CAPACITOR),
+    TopologyId.DC_DC_BUCK_BOOST: (ComponentType.MOSFET, ComponentType.DIODE, ComponentType.INDUCTOR, ComponentType.CAPACITOR),
+    TopologyId.DC_DC_CUK: (ComponentType.MOSFET, ComponentType.DIODE, ComponentType.INDUCTOR, ComponentType.CAPACITOR),
+    TopologyId.DC_DC_FLYBACK: (ComponentType.MOSFET, ComponentType.DIODE, ComponentType.CAPACITOR),
+    TopologyId.AC_DC_RECTIFIER_SINGLE: (ComponentType.DIODE, ComponentType.CAPACITOR),
+    TopologyId.AC_DC_RECTIFIER_FULL: (ComponentType.DIODE, ComponentType.CAPACITOR),
+    TopologyId.DC_AC_HALF_BRIDGE: (ComponentType.MOSFET, ComponentType.CAPACITOR),
+    TopologyId.DC_AC_FULL_BRIDGE_SINGLE: (ComponentType.MOSFET, ComponentType.CAPACITOR),
+    TopologyId.DC_AC_FULL_BRIDGE_THREE: (ComponentType.MOSFET, ComponentType.CAPACITOR),
+}
+
+
+# Nombres a mostrar por clase de componente en el catálogo
+_COMPONENT_TYPE_NAMES = MappingProxyType({
+    "MOSFET": "MOSFETs",
+    "Diode": "Diodos",
+    "Capacitor": "Capacitores",
+    "Inductor": "Inductores",
+    "Component": "Componentes",
+})
+
+
+# Pesos de priorización por defecto (inmutables, compartidos entre instancias)
+_DEFAULT_WEIGHTS = PrioritizationWeights(
+    cost=0.30,
+    availability=0.25,
+    efficiency=0.25,
+    thermal=0.20
+)
+
+_CATALOG_TITLE = "🔌 COMPONENTES RECOMENDADOS"
+
+
+def _catalog_message(message: str, style: str = "") -> Text:
+    """Build a catalog panel body holding only a short message under the title."""
+    text = Text()
+    text.append(f"{_CATALOG_TITLE}\n\n", style="bold")
+    text.append(message, style=style)
+    return text
+
+
+def _fmt_farad(value: float) -> str:
+    # Faradios - típicamente muy pequeños
+    magnitude = abs(value)
+    if magnitude < 1e-6:
+        return f"{value*1e9:.3f} nF"
+    if magnitude < 1e-3:
+        return f"{value*1e6:.3f} µF"
+    if magnitude < 1:
+        return f"{value*1e3:.3f} mF"
+    return f"{value:.6f} F"
+
+
+def _fmt_henry(value: float) -> str:
+    magnitude = abs(value)
+    if magnitude < 1e-6:
+        return f"{value*1e9:.3f} nH"
+    if magnitude < 1e-3:
+        return f"{value*1e6:.3f} µH"
+    if magnitude < 1:
+        return f"{value*1e3:.3f} mH"
+    return f"{value:.6f} H"
+
+
+def _fmt_hertz(value: float) -> str:
+    magnitude = abs(value)
+    if magnitude >= 1e6:
+        return f"{value/1e6:.3f} MHz"
+    if magnitude >= 1e3:
+        return f"{value/1e3:.3f} kHz"
+    return f"{value:.3f} Hz"
+
+
+def _fmt_pct(value: float) -> str:
+    return f"{value:.2f}%"
+
+
+def _fmt_bare(value: float) -> str:
+    return f"{value:.4g}"
+
+
+def _make_generic(unit: str) -> Callable[[float], str]:
+    def _fmt_generic(value: float) -> str:
+        return f"{value:.4g} {unit}"
+    return _fmt_generic
+
+
+# Tabla de formateadores indexada por id entero: 0=sin unidad, 1=F, 2=H, 3=Hz, 4=%
+# y a partir de 5 un formateador genérico por cada unidad restante (V, A, W...)
+_FMT_TABLE: List[Callable[[float], str]] = [_fmt_bare, _fmt_farad, _fmt_henry, _fmt_hertz, _fmt_pct]
+_UNIT_TO_FMT_ID: Dict[str, int] = {"": 0, "F": 1, "H": 2, "Hz": 3, "%": 4}
+
+# Id de formateador resuelto por clave de salida en tiempo de importación
+_KEY_TO_FMT_ID: Dict[str, int] = {}
+for _key, _unit in OUTPUT_UNITS.items():
+    if _unit not in _UNIT_TO_FMT_ID:
+        _UNIT_TO_FMT_ID[_unit] = len(_FMT_TABLE)
+        _FMT_TABLE.append(_make_generic(_unit))
+    _KEY_TO_FMT_ID[_key] = _UNIT_TO_FMT_ID[_unit]
+del _key, _unit
 
 
 def _format_value_with_unit(key: str, value: float) -> str:
     """Formatea un valor con su unidad correspondiente."""
-    unit = OUTPUT_UNITS.get(key, "")
-    
-    # Formateo especial para diferentes magnitudes
-    if unit == "F":  # Faradios - típicamente muy pequeños
-        if abs(value) < 1e-6:
-            return f"{value*1e9:.3f} nF"
-        elif abs(value) < 1e-3:
-            return f"{value*1e6:.3f} µF"
-        elif abs(value) < 1:
-            return f"{value*1e3:.3f} mF"
-        else:
-            return f"{value:.6f} F"
-    elif unit == "H":  # Henrios
-        if abs(value) < 1e-6:
-            return f"{value*1e9:.3f} nH"
-        elif abs(value) < 1e-3:
-            return f"{value*1e6:.3f} µH"
-        elif abs(value) < 1:
-            return f"{value*1e3:.3f} mH"
-        else:
-            return f"{value:.6f} H"
-    elif unit == "Hz":  # Frecuencias
-        if abs(value) >= 1e6:
-            return f"{value/1e6:.3f} MHz"
-        elif abs(value) >= 1e3:
-            return f"{value/1e3:.3f} kHz"
-        else:
-            return f"{value:.3f} Hz"
-    elif unit == "%":
-        return f"{value:.2f}%"
-    elif unit:
-        return f"{value:.4g} {unit}"
-    else:
-        return f"{value:.4g}"
+    if isinstance(key, str):
+        key = sys.intern(key)
+    return _FMT_TABLE[_KEY_TO_FMT_ID.get(key, 0)](value)
+
+
+def _first_present(*sources_and_keys: tuple[Mapping[str, float], str]) -> Optional[float]:
+    """Devuelve el primer valor no nulo de los pares (mapeo, clave), en orden."""
+    for source, key in sources_and_keys:
+        value = source.get(key)
+        if value:
+            return value
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _display_name(key: str) -> str:
+    """Convierte una clave interna (``vo_avg``) en un nombre legible (``Vo Avg``)."""
+    return key.replace("_", " ").title()
+
+
+def _fmt_ohms(decimals: int) -> Callable[[float], str]:
+    def _fmt(value: float) -> str:
+        if value < 1:
+            return f"{value*1000:.1f}mΩ"
+        return f"{value:.{decimals}f}Ω"
+    return _fmt
+
+
+def _fmt_capacitance(value: float) -> str:
+    cap_uf = value * 1e6
+    if cap_uf >= 1000:
+        return f"{cap_uf/1000:.2f}mF"
+    if cap_uf >= 1:
+        return f"{cap_uf:.1f}µF"
+    return f"{value * 1e9:.1f}nF"
+
+
+def _fmt_inductance(value: float) -> str:
+    ind_uh = value * 1e6
+    if ind_uh >= 1000:
+        return f"{ind_uh/1000:.2f}mH"
+    return f"{ind_uh:.1f}µH"
+
+
+# Valores de catálogo que equivalen a "sin dato"
+_SENTINELS = frozenset({"Unknown", "", None})
+_NO_SKIP: frozenset = frozenset()
+
+# Tablas de especificaciones por tipo: (atributo, etiqueta, formato, valores a omitir)
+# El formato es una plantilla str.format o una función valor -> texto.
+_SpecRow = tuple[str, str, Callable[[float], str] | str, frozenset]
+
+_MOSFET_SPECS: tuple[_SpecRow, ...] = (
+    ("vds_max", "VDS(max)", "{}V", _NO_SKIP),
+    ("id_continuous", "ID(cont)", "{}A", _NO_SKIP),
+    ("id_pulsed", "ID(pulsed)", "{}A", _NO_SKIP),
+    ("rds_on", "RDS(on)", _fmt_ohms(3), _NO_SKIP),
+    ("vgs_threshold", "VGS(th)", "{}V", _NO_SKIP),
+    ("qg_total", "Qg", "{}nC", _NO_SKIP),
+    ("type", "Tipo", "{}", _NO_SKIP),
+    ("package", "Package", "{}", _SENTINELS),
+)
+
+_DIODE_SPECS: tuple[_SpecRow, ...] = (
+    ("vrrm", "VRRM", "{}V", _NO_SKIP),
+    ("if_avg", "IF(avg)", "{}A", _NO_SKIP),
+    ("vf", "VF", "{}V", _NO_SKIP),
+    ("trr", "trr", "{}ns", _NO_SKIP),
+    ("type", "Tipo", "{}", _SENTINELS | {"Schottky"}),
+    ("package", "Package", "{}", _SENTINELS),
+)
+
+_CAPACITOR_SPECS: tuple[_SpecRow, ...] = (
+    ("capacitance", "C", _fmt_capacitance, _NO_SKIP),
+    ("voltage_rating", "V(rated)", "{}V", _NO_SKIP),
+    ("tolerance", "Tol", "±{}%", _NO_SKIP),
+    ("esr", "ESR", _fmt_ohms(2), _NO_SKIP),
+    ("ripple_current", "I(ripple)", "{}A", _NO_SKIP),
+    ("dielectric", "Dieléctrico", "{}", _SENTINELS),
+    ("package", "Package", "{}", _SENTINELS),
+)
+
+_INDUCTOR_SPECS: tuple[_SpecRow, ...] = (
+    ("inductance", "L", _fmt_inductance, _NO_SKIP),
+    ("current_rating", "I(rated)", "{}A", _NO_SKIP),
+    ("saturation_current", "I(sat)", "{}A", _NO_SKIP),
+    ("dcr", "DCR", _fmt_ohms(3), _NO_SKIP),
+    ("core_material", "Núcleo", "{}", _SENTINELS),
+    ("package", "Package", "{}", _SENTINELS),
+)
+
+
+def _compile_spec_table(
+    table: tuple[_SpecRow, ...],
+) -> tuple[tuple[str, str, Callable[[object], str], frozenset], ...]:
+    """Resuelve las plantillas de texto a funciones una sola vez, al importar."""
+    return tuple(
+        (attr, label, fmt if callable(fmt) else fmt.format, skip)
+        for attr, label, fmt, skip in table
+    )
+
+
+# Tabla de especificaciones compilada por subclase de componente
+_SPEC_TABLES = {
+    MOSFET: _compile_spec_table(_MOSFET_SPECS),
+    Diode: _compile_spec_table(_DIODE_SPECS),
+    Capacitor: _compile_spec_table(_CAPACITOR_SPECS),
+    Inductor: _compile_spec_table(_INDUCTOR_SPECS),
+}
+
+
+def _format_specs(comp: Component, table) -> List[str]:
+    specs = []
+    for attr, label, fmt, skip in table:
+        value = getattr(comp, attr, None)
+        if value and value not in skip:
+            specs.append(f"{label}: {fmt(value)}")
+    return specs
 
 
 @dataclass(slots=True)
@@ -183,10 +392,11 @@ class FormState:
         operating: Dict[str, float] = {}
         constraints: Dict[str, float] = {}
 
+        parse = _parse_numeric
         for key, field_state in self.fields.items():
-            operating[key] = _parse_numeric(field_state.definition, field_state.value())
+            operating[key] = parse(field_state.definition, field_state.value())
         for key, field_state in self.constraint_fields.items():
-            constraints[key] = _parse_numeric(field_state.definition, field_state.value())
+            constraints[key] = parse(field_state.definition, field_state.value())
 
         return ConverterSpec(
             topology_id=self.topology.topology_id.value,
@@ -196,20 +406,34 @@ class FormState:
 
 
 def _parse_numeric(defn: FieldDefinition, raw: str) -> float:
-    if raw == "" and defn.default is not None:
-        raw = str(defn.default)
+    return _parse_numeric_cached(raw, defn.default, defn.allow_negative, defn.allow_zero, defn.label)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_numeric_cached(
+    raw: str,
+    default: float | str | None,
+    allow_negative: bool,
+    allow_zero: bool,
+    label: str,
+) -> float:
+    # Only successful parses are cached; errors are raised again on every call
+    if raw == "" and default is not None:
+        raw = str(default)
     try:
         value = float(raw)
     except ValueError as exc:
-        raise ValueError(f"El campo '{defn.label}' requiere un valor numérico") from exc
-    if value < 0 and not defn.allow_negative:
-        raise ValueError(f"El campo '{defn.label}' debe ser positivo")
-    if value == 0 and not defn.allow_zero:
-        raise ValueError(f"El campo '{defn.label}' no puede ser cero")
+        raise ValueError(f"El campo '{label}' requiere un valor numérico") from exc
+    if value < 0 and not allow_negative:
+        raise ValueError(f"El campo '{label}' debe ser positivo")
+    if value == 0 and not allow_zero:
+        raise ValueError(f"El campo '{label}' no puede ser cero")
     return value
 
 
 class RunDesignMessage(Message):
+    __slots__ = ("form_state",)
+
     def __init__(self, form_state: FormState) -> None:
         self.form_state = form_state
         super().__init__()
@@ -254,6 +478,10 @@ class DesignWizardApp(App[None]):
         width: 100%;
         margin-bottom: 1;
     }
+    #status-line {
+        width: 100%;
+        text-style: italic;
+    }
     #results {
         border: solid $accent;
         background: $surface;
@@ -322,28 +550,22 @@ class DesignWizardApp(App[None]):
         self._workflow = container.workflow
         self._factory = container.factory
         self._forms = available_forms([info.topology_id for info in self._factory.available_topologies()])
+        self._forms_by_id: Dict[TopologyId, TopologyForm] = {form.topology_id: form for form in self._forms}
         self._current_form: Optional[FormState] = None
         
-        # Initialize component recommendation service with Mouser
+        # Pending widget contents, flushed once per frame by _flush_ui
+        self._status_dirty: Optional[str] = None
+        self._results_dirty: Optional[str] = None
+        self._catalog_dirty: Optional[Text] = None
+        
+        # Component recommendation service with Mouser is initialized after first paint
         self._mouser_adapter = None
         self._component_service = None
-        try:
-            self._mouser_adapter = MouserAdapter()
-            self._component_service = ComponentRecommendationService(
-                catalogs=[self._mouser_adapter],
-                cache=None  # No cache for MVP
-            )
-            logger.info("✅ Mouser adapter initialized successfully")
-        except Exception as e:
-            logger.error(f"⚠️  Mouser API not available: {e}", exc_info=True)
         
         # Default prioritization weights
-        self._current_weights = PrioritizationWeights(
-            cost=0.30,
-            availability=0.25,
-            efficiency=0.25,
-            thermal=0.20
-        )
+        self._current_weights = _DEFAULT_WEIGHTS
+        self._selector: Optional[ComponentSelector] = None
+        self._cached_weights_key: Optional[tuple[float, float, float, float]] = None
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -390,8 +612,9 @@ class DesignWizardApp(App[None]):
 
     def _build_form_panel(self) -> Container:
         self._form_scroll = VerticalScroll(id="form-scroll")
-        self._status = Markdown("Seleccione una topología para comenzar.", id="results")
-        self._component_catalog = Markdown("", id="component-catalog")
+        self._status_line = Label("Seleccione una topología para comenzar.", id="status-line")
+        self._results = Markdown("", id="results")
+        self._component_catalog = RichLog(id="component-catalog", markup=False, highlight=False, wrap=True)
         buttons = Horizontal(
             Button("Calcular", id="run-button", variant="success"),
             Button("Limpiar", id="clear-button", variant="primary"),
@@ -400,7 +623,8 @@ class DesignWizardApp(App[None]):
         return Container(
             Label("Especificaciones", classes="title", id="form-title"),
             self._form_scroll,
-            self._status,
+            self._status_line,
+            self._results,
             self._component_catalog,
             buttons,
             id="form-pane",
@@ -409,6 +633,41 @@ class DesignWizardApp(App[None]):
     async def on_mount(self) -> None:
         select = self.query_one("#topology-select", Select)
         select.focus()
+        self._weight_inputs = tuple(
+            self.query_one(f"#weight-{name}", Input)
+            for name in ("cost", "availability", "efficiency", "thermal")
+        )
+        self.set_interval(UI_FLUSH_INTERVAL, self._flush_ui)
+        self.run_worker(self._async_init_catalog(), exclusive=True)
+
+    async def _async_init_catalog(self) -> None:
+        """Import and build the Mouser-backed recommendation service off the startup path."""
+        try:
+            from tutor_virtual.application.services.component_recommendation import ComponentRecommendationService
+            from tutor_virtual.infrastructure.catalogs.mouser import MouserAdapter
+
+            self._mouser_adapter = MouserAdapter()
+            self._component_service = ComponentRecommendationService(
+                catalogs=[self._mouser_adapter],
+                cache=None  # No cache for MVP
+            )
+            logger.info("✅ Mouser adapter initialized successfully")
+        except Exception as e:
+            logger.error(f"⚠️  Mouser API not available: {e}", exc_info=True)
+
+    def _flush_ui(self) -> None:
+        """Render the latest pending status/results/catalog text, at most once per tick."""
+        if self._status_dirty is not None:
+            self._status_line.update(self._status_dirty)
+            self._status_dirty = None
+        if self._results_dirty is not None:
+            self._results.update(self._results_dirty)
+            self._results_dirty = None
+        if self._catalog_dirty is not None:
+            self._component_catalog.clear()
+            if self._catalog_dirty:
+                self._component_catalog.write(self._catalog_dirty)
+            self._catalog_dirty = None
 
     async def on_select_changed(self, event: Select.Changed) -> None:
         topology_value = event.value
@@ -416,11 +675,11 @@ class DesignWizardApp(App[None]):
             # User selected the placeholder/prompt, clear the form
             for child in list(self._form_scroll.children):
                 await child.remove()
-            self._status.update("Seleccione una topología para comenzar.")
+            self._set_status("Seleccione una topología para comenzar.")
             self.selected_topology = None
             return
         topology = TopologyId(topology_value)
-        form_def = next(form for form in self._forms if form.topology_id == topology)
+        form_def = self._forms_by_id[topology]
         await self._render_form(form_def)
         self.selected_topology = topology
 
@@ -448,7 +707,12 @@ class DesignWizardApp(App[None]):
         self._current_form = form_state
         if first_focus is not None:
             first_focus.focus()
-        self._status.update("Ingrese los parámetros y presione Calcular (Ctrl+S).")
+        self._set_status("Ingrese los parámetros y presione Calcular (Ctrl+S).")
+
+    def _set_status(self, text: str) -> None:
+        """Show a one-line status message and clear the results area."""
+        self._status_dirty = text
+        self._results_dirty = ""
 
     def _create_field_widgets(self, definition: FieldDefinition) -> tuple[Label, Input]:
         # Display units prominently in the label
@@ -473,88 +737,88 @@ class DesignWizardApp(App[None]):
     async def _handle_run(self) -> None:
         if not self._current_form:
             self.bell()
-            self._status.update("Seleccione una topología antes de calcular.")
+            self._set_status("Seleccione una topología antes de calcular.")
             return
         try:
             spec = self._current_form.to_spec()
             context = DesignContext(user_id="demo", project_id="demo-project")
-            result = self._workflow.run_predesign(DesignRequest(context=context, spec=spec))
+            # Keep the Textual event loop responsive while the predesign math runs
+            result = await asyncio.to_thread(self._workflow.run_predesign, DesignRequest(context=context, spec=spec))
         except ValidationFailedError as exc:
             issues = "\n".join(f"- {issue.message}" for issue in exc.issues)
-            self._status.update(f"Validación bloqueante:\n{issues}")
+            self._status_dirty = "Validación bloqueante:"
+            self._results_dirty = issues
             self.bell()
             return
         except Exception as exc:  # pragma: no cover - UI feedback
-            self._status.update(f"Error: {exc}")
+            self._set_status(f"Error: {exc}")
             self.bell()
             return
 
         # Formatear resultados de forma estética con unidades
-        lines = ["# 📊 RESULTADO DEL PREDISEÑO"]
+        parts: List[str] = ["# 📊 RESULTADO DEL PREDISEÑO\n"]
+        fmt = _format_value_with_unit
+        disp = _display_name
+        add = parts.append
         
         # Parámetros principales
-        if result.predesign.primary_values:
-            lines.append("## ⚡ PARÁMETROS PRINCIPALES")
-            for key, value in result.predesign.primary_values.items():
-                formatted_value = _format_value_with_unit(key, value)
-                # Hacer el nombre más legible
-                display_name = key.replace("_", " ").title()
-                lines.append(f"**• {display_name}:** {formatted_value}")
-                lines.append("")  # Línea vacía entre items
+        primary_values = result.predesign.primary_values
+        if primary_values:
+            add("## ⚡ PARÁMETROS PRINCIPALES\n")
+            for key, value in primary_values.items():
+                # Línea vacía entre items
+                add(f"**• {disp(key)}:** {fmt(key, value)}\n\n")
         
         # Pérdidas estimadas - solo mostrar si hay datos
-        if result.losses.totals and any(result.losses.totals.values()):
-            lines.append("## 🔥 PÉRDIDAS ESTIMADAS")
+        loss_totals = result.losses.totals
+        if loss_totals and any(loss_totals.values()):
+            add("## 🔥 PÉRDIDAS ESTIMADAS\n")
             total_losses = 0
-            for key, value in result.losses.totals.items():
-                formatted_value = _format_value_with_unit(key, value)
-                display_name = key.replace("_", " ").title()
-                lines.append(f"**• {display_name}:** {formatted_value}")
-                lines.append("")  # Línea vacía entre items
+            for key, value in loss_totals.items():
+                add(f"**• {disp(key)}:** {fmt(key, value)}\n\n")
                 if "loss" in key.lower():
                     total_losses += value
             if total_losses > 0:
-                lines.append(f"**Pérdidas Totales:** {_format_value_with_unit('total_loss', total_losses)}")
+                add(f"**Pérdidas Totales:** {fmt('total_loss', total_losses)}\n")
         
         # Advertencias
         if result.issues:
-            lines.append("## ⚠️ ADVERTENCIAS")
+            add("## ⚠️ ADVERTENCIAS\n")
             for issue in result.issues:
-                severity_emoji = "🔴" if issue.severity.value == "error" else "🟡"
-                lines.append(f"**{severity_emoji} {issue.severity.value.upper()}:** {issue.message}")
-                lines.append("")  # Línea vacía entre items
+                severity = issue.severity.value
+                severity_emoji = "🔴" if severity == "error" else "🟡"
+                add(f"**{severity_emoji} {severity.upper()}:** {issue.message}\n\n")
         
-        self._status.update("\n".join(lines))
+        self._status_dirty = "Cálculo completado."
+        self._results_dirty = "".join(parts)
         
         # Search for recommended components
         if self._component_service:
             await self._search_components(result)
         else:
-            self._component_catalog.update("## 🔌 COMPONENTES RECOMENDADOS\n\nComponentes no disponibles en este momento.")
+            self._catalog_dirty = _catalog_message("Componentes no disponibles en este momento.")
 
     async def _handle_clear(self) -> None:
         if not self._current_form:
             return
-        for field_state in list(self._current_form.fields.values()) + list(self._current_form.constraint_fields.values()):
+        for field_state in chain(self._current_form.fields.values(), self._current_form.constraint_fields.values()):
             field_state.widget.value = str(field_state.definition.default or "")
-        self._status.update("Campos reiniciados. Modifique valores y ejecute nuevamente.")
-        self._component_catalog.update("")
+        self._set_status("Campos reiniciados. Modifique valores y ejecute nuevamente.")
+        self._catalog_dirty = Text()
     
     def _get_current_weights(self) -> PrioritizationWeights:
         """Read prioritization weights from UI inputs."""
         try:
-            cost = float(self.query_one("#weight-cost", Input).value)
-            availability = float(self.query_one("#weight-availability", Input).value)
-            efficiency = float(self.query_one("#weight-efficiency", Input).value)
-            thermal = float(self.query_one("#weight-thermal", Input).value)
+            values = tuple(float(widget.value) for widget in self._weight_inputs)
             
             # Validate sum equals 1.0
-            total = cost + availability + efficiency + thermal
+            total = math.fsum(values)
             if abs(total - 1.0) > 0.01:
                 logger.warning(f"⚠️  Pesos no suman 1.0 (actual: {total:.2f}), usando valores por defecto")
-                return self._current_weights  # Return defaults
+                return _DEFAULT_WEIGHTS  # Return defaults
             
             # Create new weights
+            cost, availability, efficiency, thermal = values
             return PrioritizationWeights(
                 cost=cost,
                 availability=availability,
@@ -564,43 +828,60 @@ class DesignWizardApp(App[None]):
             
         except ValueError as e:
             logger.warning(f"⚠️  Error leyendo pesos: {e}, usando valores por defecto")
-            return self._current_weights  # Return defaults
+            return _DEFAULT_WEIGHTS  # Return defaults
+    
+    def _get_selector(self) -> ComponentSelector:
+        """Return a selector for the current UI weights, reusing the last one if unchanged."""
+        weights = self._get_current_weights()
+        key = (weights.cost, weights.availability, weights.efficiency, weights.thermal)
+        if self._selector is None or key != self._cached_weights_key:
+            self._selector = ComponentSelector(weights=weights)
+            self._cached_weights_key = key
+        return self._selector
     
     async def _search_components(self, result: DesignSessionResult) -> None:
         """Search for recommended components based on design results."""
-        self._component_catalog.update("## 🔌 COMPONENTES RECOMENDADOS\n\n🔄 **Buscando componentes...**")
+        catalog_widget = self._component_catalog
+        loading = LoadingIndicator(id="component-loading")
+        catalog_widget.display = False
+        await catalog_widget.parent.mount(loading, before=catalog_widget)
         
         try:
             # Determine component requirements from design results
             requirements_list = self._extract_component_requirements(result)
             
             if not requirements_list:
-                self._component_catalog.update("## 🔌 COMPONENTES RECOMENDADOS\n\nNo se detectaron componentes necesarios para esta topología.")
+                self._catalog_dirty = _catalog_message("No se detectaron componentes necesarios para esta topología.")
                 return
             
             all_components = []
+            catalogs = self._component_service.catalogs
+            
+            # Dispatch every (requirement, catalog) search at once; they are independent
+            req_index = []
+            tasks = []
+            for idx, requirements in enumerate(requirements_list):
+                for catalog in catalogs:
+                    req_index.append(idx)
+                    tasks.append(catalog.search_components(requirements=requirements, limit=5))
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            
+            found_by_req: List[List[Component]] = [[] for _ in requirements_list]
+            for idx, catalog_result in zip(req_index, results):
+                if isinstance(catalog_result, BaseException):
+                    # CancelledError is a BaseException; one failed catalog must not drop the others
+                    logger.error("Error searching components for %s: %s", requirements_list[idx].component_type, catalog_result)
+                    continue
+                found_by_req[idx].extend(catalog_result)
+            
+            # Read current weights from UI inputs once per search
+            selector = self._get_selector()
             
-            # Search for each component type
-            for idx, requirements in enumerate(requirements_list, 1):
+            # Rank the results of each component type
+            for requirements, components in zip(requirements_list, found_by_req):
                 try:
-                    # Note: recommend_components expects different parameters
-                    # For now, search directly through catalogs
-                    components = []
-                    for catalog in self._component_service.catalogs:
-                        try:
-                            catalog_components = await catalog.search_components(
-                                requirements=requirements,
-                                limit=5
-                            )
-                            components.extend(catalog_components)
-                        except Exception as catalog_error:
-                            pass  # Silently skip catalog errors
-                    
                     # Apply prioritization with current weights from UI
                     if components:
-                        # Read current weights from UI inputs
-                        current_weights = self._get_current_weights()
-                        selector = ComponentSelector(weights=current_weights)
                         scored = selector.select_top_components(
                             components=components,
                             requirements=requirements,
@@ -613,68 +894,59 @@ class DesignWizardApp(App[None]):
             
             # Format results
             if all_components:
-                catalog_md = self._format_component_catalog(all_components)
-                self._component_catalog.update(catalog_md)
+                self._catalog_dirty = self._format_component_catalog(all_components)
             else:
-                self._component_catalog.update("## 🔌 COMPONENTES RECOMENDADOS\n\nNo se encontraron componentes que cumplan los requisitos.")
+                self._catalog_dirty = _catalog_message("No se encontraron componentes que cumplan los requisitos.")
         
         except Exception as e:
             logger.error(f"❌ ERROR CRÍTICO en búsqueda de componentes: {type(e).__name__}: {e}", exc_info=True)
-            self._component_catalog.update("## 🔌 COMPONENTES RECOMENDADOS\n\nComponentes no disponibles en este momento.")
+            self._catalog_dirty = _catalog_message("Componentes no disponibles en este momento.")
+        finally:
+            await loading.remove()
+            catalog_widget.display = True
     
     def _extract_component_requirements(self, result: DesignSessionResult) -> List[ComponentRequirements]:
         """Extract component requirements from design session result."""
         requirements_list = []
         primary = result.predesign.primary_values
         topology = TopologyId(result.spec.topology_id)
+        _dbg = logger.isEnabledFor(logging.DEBUG)
         
-        logger.debug(f"\n🔧 Extracting requirements for topology: {topology.value}")
-        logger.debug(f"📊 Primary values from pre-design:")
-        for key, value in primary.items():
-            logger.debug(f"   {key}: {value}")
+        if _dbg:
+            logger.debug(f"\n🔧 Extracting requirements for topology: {topology.value}")
+            logger.debug(f"📊 Primary values from pre-design:")
+            for key, value in primary.items():
+                logger.debug(f"   {key}: {value}")
         
-        # Map topology to required component types
-        topology_components = {
-            TopologyId.DC_DC_BUCK: [ComponentType.MOSFET, ComponentType.DIODE, ComponentType.INDUCTOR, ComponentType.CAPACITOR],
-            TopologyId.DC_DC_BOOST: [ComponentType.MOSFET, ComponentType.DIODE, ComponentType.INDUCTOR, ComponentType.CAPACITOR],
-            TopologyId.DC_DC_BUCK_BOOST: [ComponentType.MOSFET, ComponentType.DIODE, ComponentType.INDUCTOR, ComponentType.CAPACITOR],
-            TopologyId.DC_DC_CUK: [ComponentType.MOSFET, ComponentType.DIODE, ComponentType.INDUCTOR, ComponentType.CAPACITOR],
-            TopologyId.DC_DC_FLYBACK: [ComponentType.MOSFET, ComponentType.DIODE, ComponentType.CAPACITOR],
-            TopologyId.AC_DC_RECTIFIER_SINGLE: [ComponentType.DIODE, ComponentType.CAPACITOR],
-            TopologyId.AC_DC_RECTIFIER_FULL: [ComponentType.DIODE, ComponentType.CAPACITOR],
-            TopologyId.DC_AC_HALF_BRIDGE: [ComponentType.MOSFET, ComponentType.CAPACITOR],
-            TopologyId.DC_AC_FULL_BRIDGE_SINGLE: [ComponentType.MOSFET, ComponentType.CAPACITOR],
-            TopologyId.DC_AC_FULL_BRIDGE_THREE: [ComponentType.MOSFET, ComponentType.CAPACITOR],
-        }
-        
-        component_types = topology_components.get(topology, [])
-        logger.debug(f"\n🎯 Required components: {[ct.value for ct in component_types]}")
+        component_types = _TOPOLOGY_COMPONENTS.get(topology, ())
+        if _dbg:
+            logger.debug(f"\n🎯 Required components: {[ct.value for ct in component_types]}")
         
         # Extract voltage and current from operating conditions (input) and results
         operating = result.spec.operating_conditions
         
         # Voltage: prefer input specs, fallback to calculated values
-        voltage_max = (
-            operating.get("vin") or 
-            operating.get("vdc") or 
-            operating.get("vin_max") or
-            primary.get("vin") or 
-            primary.get("vdc") or 
-            primary.get("vo_avg") or 
-            primary.get("vac_rms", 0)
+        voltage_max = _first_present(
+            (operating, "vin"),
+            (operating, "vdc"),
+            (operating, "vin_max"),
+            (primary, "vin"),
+            (primary, "vdc"),
+            (primary, "vo_avg"),
+            (primary, "vac_rms"),
         )
         voltage_original = voltage_max
         if voltage_max:
             voltage_max *= 1.5  # Safety margin
         
         # Current: prefer input specs, fallback to calculated values
-        current_max = (
-            operating.get("io_max") or
-            operating.get("io") or
-            primary.get("io_max") or 
-            primary.get("il_avg") or 
-            primary.get("io_avg") or
-            primary.get("i_l_rms", 0)
+        current_max = _first_present(
+            (operating, "io_max"),
+            (operating, "io"),
+            (primary, "io_max"),
+            (primary, "il_avg"),
+            (primary, "io_avg"),
+            (primary, "i_l_rms"),
         )
         current_original = current_max
         if current_max:
@@ -683,11 +955,12 @@ class DesignWizardApp(App[None]):
         inductance = primary.get("inductance") or primary.get("l_min")
         capacitance = primary.get("capacitance") or primary.get("c_min") or primary.get("required_capacitance")
         
-        logger.debug(f"\n⚡ Extracted values:")
-        logger.debug(f"   Voltage: {voltage_original}V → {voltage_max}V (with 1.5x margin)")
-        logger.debug(f"   Current: {current_original}A → {current_max}A (with 1.2x margin)")
-        logger.debug(f"   Inductance: {inductance*1e6 if inductance else 0:.2f}µH")
-        logger.debug(f"   Capacitance: {capacitance*1e6 if capacitance else 0:.2f}µF")
+        if _dbg:
+            logger.debug(f"\n⚡ Extracted values:")
+            logger.debug(f"   Voltage: {voltage_original}V → {voltage_max}V (with 1.5x margin)")
+            logger.debug(f"   Current: {current_original}A → {current_max}A (with 1.2x margin)")
+            logger.debug(f"   Inductance: {inductance*1e6 if inductance else 0:.2f}µH")
+            logger.debug(f"   Capacitance: {capacitance*1e6 if capacitance else 0:.2f}µF")
         
         # Create requirements for each component type
         for comp_type in component_types:
@@ -699,165 +972,72 @@ class DesignWizardApp(App[None]):
                 capacitance_min=capacitance if comp_type == ComponentType.CAPACITOR and capacitance else None,
             )
             requirements_list.append(req)
-            logger.debug(f"   ✓ Created requirement for {comp_type.value}")
+            if _dbg:
+                logger.debug(f"   ✓ Created requirement for {comp_type.value}")
         
         return requirements_list
     
-    def _format_component_catalog(self, components: List[Component]) -> str:
-        """Format component list as Markdown catalog with detailed specifications."""
-        lines = ["## 🔌 COMPONENTES RECOMENDADOS\n"]
+    def _format_component_catalog(self, components: List[Component]) -> Text:
+        """Format component list as a styled catalog with detailed specifications."""
+        text = Text()
+        add = text.append
+        add(f"{_CATALOG_TITLE}\n\n", style="bold")
         
-        # Group by component type using actual class names
-        by_type: Dict[str, List[Component]] = {}
+        # Group by component type using actual class names (MOSFET, Diode, Capacitor, Inductor)
+        by_type: defaultdict[str, List[Component]] = defaultdict(list)
         for comp in components:
-            # Get the actual class name (MOSFET, Diode, Capacitor, Inductor)
-            comp_type = type(comp).__name__
-            if comp_type not in by_type:
-                by_type[comp_type] = []
-            by_type[comp_type].append(comp)
+            by_type[type(comp).__name__].append(comp)
         
         # Format each group with proper type names
-        type_names = {
-            "MOSFET": "MOSFETs",
-            "Diode": "Diodos",
-            "Capacitor": "Capacitores",
-            "Inductor": "Inductores",
-            "Component": "Componentes"
-        }
-        
         for comp_type, comp_list in by_type.items():
-            display_name = type_names.get(comp_type, f"{comp_type}s")
-            lines.append(f"### {display_name}\n")
+            display_name = _COMPONENT_TYPE_NAMES.get(comp_type, f"{comp_type}s")
+            add(f"{display_name}\n\n", style="bold cyan")
             
             for i, comp in enumerate(comp_list[:5], 1):  # Max 5 per type
-                lines.append(f"**{i}. {comp.manufacturer} - {comp.part_number}**")
+                add(f"{i}. {comp.manufacturer} - {comp.part_number}\n", style="bold")
                 
                 # Description (truncated if too long)
                 if comp.description:
                     desc = comp.description[:80] + "..." if len(comp.description) > 80 else comp.description
-                    lines.append(f"   {desc}")
+                    add(f"   {desc}\n")
                 
                 # Price and availability
-                lines.append(f"   **Precio:** ${comp.price_usd:.2f} | **Stock:** {comp.availability} unidades")
+                add("   Precio: ", style="bold")
+                add(f"${comp.price_usd:.2f} | ")
+                add("Stock: ", style="bold")
+                add(f"{comp.availability} unidades\n")
                 
-                # MOSFET specific specs
-                if hasattr(comp, 'vds_max'):
-                    specs = []
-                    if comp.vds_max:
-                        specs.append(f"VDS(max): {comp.vds_max}V")
-                    if hasattr(comp, 'id_continuous') and comp.id_continuous:
-                        specs.append(f"ID(cont): {comp.id_continuous}A")
-                    if hasattr(comp, 'id_pulsed') and comp.id_pulsed:
-                        specs.append(f"ID(pulsed): {comp.id_pulsed}A")
-                    if hasattr(comp, 'rds_on') and comp.rds_on:
-                        if comp.rds_on < 1:
-                            specs.append(f"RDS(on): {comp.rds_on*1000:.1f}mΩ")
-                        else:
-                            specs.append(f"RDS(on): {comp.rds_on:.3f}Ω")
-                    if hasattr(comp, 'vgs_threshold') and comp.vgs_threshold:
-                        specs.append(f"VGS(th): {comp.vgs_threshold}V")
-                    if hasattr(comp, 'qg_total') and comp.qg_total:
-                        specs.append(f"Qg: {comp.qg_total}nC")
-                    if hasattr(comp, 'type') and comp.type:
-                        specs.append(f"Tipo: {comp.type}")
-                    if hasattr(comp, 'package') and comp.package and comp.package != "Unknown":
-                        specs.append(f"Package: {comp.package}")
-                    
+                # Type-specific specs
+                table = _SPEC_TABLES.get(type(comp))
+                if table is not None:
+                    specs = _format_specs(comp, table)
                     if specs:
-                        lines.append(f"   **Especificaciones:** {' | '.join(specs)}")
-                
-                # Diode specific specs
-                elif hasattr(comp, 'vrrm'):
-                    specs = []
-                    if comp.vrrm:
-                        specs.append(f"VRRM: {comp.vrrm}V")
-                    if hasattr(comp, 'if_avg') and comp.if_avg:
-                        specs.append(f"IF(avg): {comp.if_avg}A")
-                    if hasattr(comp, 'vf') and comp.vf:
-                        specs.append(f"VF: {comp.vf}V")
-                    if hasattr(comp, 'trr') and comp.trr:
-                        specs.append(f"trr: {comp.trr}ns")
-                    if hasattr(comp, 'type') and comp.type and comp.type != "Schottky":
-                        specs.append(f"Tipo: {comp.type}")
-                    if hasattr(comp, 'package') and comp.package and comp.package != "Unknown":
-                        specs.append(f"Package: {comp.package}")
-                    
-                    if specs:
-                        lines.append(f"   **Especificaciones:** {' | '.join(specs)}")
-                
-                # Capacitor specific specs
-                elif hasattr(comp, 'capacitance'):
-                    specs = []
-                    if comp.capacitance:
-                        cap_uf = comp.capacitance * 1e6
-                        if cap_uf >= 1000:
-                            specs.append(f"C: {cap_uf/1000:.2f}mF")
-                        elif cap_uf >= 1:
-                            specs.append(f"C: {cap_uf:.1f}µF")
-                        else:
-                            cap_nf = comp.capacitance * 1e9
-                            specs.append(f"C: {cap_nf:.1f}nF")
-                    if hasattr(comp, 'voltage_rating') and comp.voltage_rating:
-                        specs.append(f"V(rated): {comp.voltage_rating}V")
-                    if hasattr(comp, 'tolerance') and comp.tolerance:
-                        specs.append(f"Tol: ±{comp.tolerance}%")
-                    if hasattr(comp, 'esr') and comp.esr:
-                        if comp.esr < 1:
-                            specs.append(f"ESR: {comp.esr*1000:.1f}mΩ")
-                        else:
-                            specs.append(f"ESR: {comp.esr:.2f}Ω")
-                    if hasattr(comp, 'ripple_current') and comp.ripple_current:
-                        specs.append(f"I(ripple): {comp.ripple_current}A")
-                    if hasattr(comp, 'dielectric') and comp.dielectric and comp.dielectric != "Unknown":
-                        specs.append(f"Dieléctrico: {comp.dielectric}")
-                    if hasattr(comp, 'package') and comp.package and comp.package != "Unknown":
-                        specs.append(f"Package: {comp.package}")
-                    
-                    if specs:
-                        lines.append(f"   **Especificaciones:** {' | '.join(specs)}")
-                
-                # Inductor specific specs
-                elif hasattr(comp, 'inductance'):
-                    specs = []
-                    if comp.inductance:
-                        ind_uh = comp.inductance * 1e6
-                        if ind_uh >= 1000:
-                            specs.append(f"L: {ind_uh/1000:.2f}mH")
-                        else:
-                            specs.append(f"L: {ind_uh:.1f}µH")
-                    if hasattr(comp, 'current_rating') and comp.current_rating:
-                        specs.append(f"I(rated): {comp.current_rating}A")
-                    if hasattr(comp, 'saturation_current') and comp.saturation_current:
-                        specs.append(f"I(sat): {comp.saturation_current}A")
-                    if hasattr(comp, 'dcr') and comp.dcr:
-                        if comp.dcr < 1:
-                            specs.append(f"DCR: {comp.dcr*1000:.1f}mΩ")
-                        else:
-                            specs.append(f"DCR: {comp.dcr:.3f}Ω")
-                    if hasattr(comp, 'core_material') and comp.core_material:
-                        specs.append(f"Núcleo: {comp.core_material}")
-                    if hasattr(comp, 'package') and comp.package and comp.package != "Unknown":
-                        specs.append(f"Package: {comp.package}")
-                    
-                    if specs:
-                        lines.append(f"   **Especificaciones:** {' | '.join(specs)}")
+                        add("   Especificaciones: ", style="bold")
+                        add(f"{' | '.join(specs)}\n")
                 
                 # Add links
                 links = []
-                if hasattr(comp, 'product_url') and comp.product_url:
-                    links.append(f"[Ver en Mouser]({comp.product_url})")
-                if hasattr(comp, 'datasheet_url') and comp.datasheet_url:
-                    links.append(f"[Datasheet]({comp.datasheet_url})")
+                product_url = comp.product_url
+                if product_url:
+                    links.append(("Ver en Mouser", product_url))
+                datasheet_url = comp.datasheet_url
+                if datasheet_url:
+                    links.append(("Datasheet", datasheet_url))
                 
                 if links:
-                    lines.append(f"   {' | '.join(links)}")
+                    add("   ")
+                    for j, (label, url) in enumerate(links):
+                        if j:
+                            add(" | ")
+                        add(label, style=Style(link=url, underline=True))
+                    add("\n")
                 
-                lines.append("")  # Empty line between components
+                add("\n")  # Empty line between components
         
-        return "\n".join(lines)
+        return text
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowContainer:
     factory: ConverterFactory
     validator: ValidationEngine
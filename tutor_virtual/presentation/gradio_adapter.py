@@ -1,9 +1,16 @@
 """Adapter to connect Gradio UI with the application logic."""
 
+import asyncio
 import logging
+import math
+import re
+import time
+from bisect import bisect_right
 import pandas as pd
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import asdict
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from dataclasses import fields as dataclass_fields
+from functools import lru_cache
+from types import MappingProxyType
 
 from tutor_virtual.application.services.design_workflow import DesignWorkflowService, ValidationFailedError
 from tutor_virtual.application.services.component_recommendation import ComponentRecommendationService
@@ -13,13 +20,13 @@ from tutor_virtual.domain.components import ComponentRequirements, ComponentType
 from tutor_virtual.domain.components.selector import ComponentSelector
 from tutor_virtual.infrastructure.catalogs.mouser import MouserAdapter
 from tutor_virtual.shared.dto import ConverterSpec, DesignContext, DesignRequest, DesignSessionResult
-from .spec_schema import FieldDefinition, TopologyForm, available_forms, FORMS
+from .spec_schema import FieldDefinition, TopologyForm, available_forms, FORMS, FORMS_BY_ID
 from .translations import get_text
 
 logger = logging.getLogger(__name__)
 
 # Mapeo de variables de salida a sus unidades (reutilizado de app.py)
-OUTPUT_UNITS = {
+OUTPUT_UNITS = MappingProxyType({
     "vo_avg": "V", "vo_rms": "V", "vo_peak": "V", "vo_min": "V", "vo_max": "V",
     "vripple": "V", "vdc": "V", "vin": "V", "vout": "V",
     "io_avg": "A", "io_rms": "A", "io_peak": "A", "il_avg": "A", "il_rms": "A",
@@ -34,54 +41,195 @@ OUTPUT_UNITS = {
     "turns_ratio": "", "np": "", "ns": "",
     "thd": "%", "modulation_index": "",
     "form_factor": "", "ripple_factor": "", "rectification_efficiency": "%",
-}
+})
+
+# Tipos de componente requeridos por cada topología (tuplas compartidas entre topologías)
+_DC_DC_PARTS = (ComponentType.MOSFET, ComponentType.DIODE, ComponentType.INDUCTOR, ComponentType.CAPACITOR)
+_RECTIFIER_PARTS = (ComponentType.DIODE, ComponentType.CAPACITOR)
+_INVERTER_PARTS = (ComponentType.MOSFET, ComponentType.CAPACITOR)
+_TOPO_COMPONENTS: Mapping[TopologyId, Tuple[ComponentType, ...]] = MappingProxyType({
+    TopologyId.DC_DC_BUCK: _DC_DC_PARTS,
+    TopologyId.DC_DC_BOOST: _DC_DC_PARTS,
+    TopologyId.DC_DC_BUCK_BOOST: _DC_DC_PARTS,
+    TopologyId.DC_DC_CUK: _DC_DC_PARTS,
+    TopologyId.DC_DC_FLYBACK: (ComponentType.MOSFET, ComponentType.DIODE, ComponentType.CAPACITOR),
+    TopologyId.AC_DC_RECTIFIER_SINGLE: _RECTIFIER_PARTS,
+    TopologyId.AC_DC_RECTIFIER_FULL: _RECTIFIER_PARTS,
+    TopologyId.DC_AC_HALF_BRIDGE: _INVERTER_PARTS,
+    TopologyId.DC_AC_FULL_BRIDGE_SINGLE: _INVERTER_PARTS,
+    TopologyId.DC_AC_FULL_BRIDGE_THREE: _INVERTER_PARTS,
+})
+
+# Mapa valor -> miembro del enum, evita el constructor TopologyId(...) y su ValueError
+_TID = TopologyId._value2member_map_
 
 COMPONENT_COLUMNS = ["Tipo", "Fabricante", "Número de Parte", "Descripción", "Precio (USD)", "Stock", "Score", "Datasheet", "Link"]
+_DESC_IDX = COMPONENT_COLUMNS.index("Descripción")
+_SEARCH_CACHE_SIZE = 256
+_SEARCH_CACHE_TTL = 60.0  # segundos; precios y stock de Mouser cambian
+
+def _round_opt(value: Optional[float], ndigits: int) -> Optional[float]:
+    return None if value is None else round(value, ndigits)
+
+def _requirements_fingerprint(req: ComponentRequirements) -> Tuple[Any, ...]:
+    """Cache key for a search; rounding absorbs float noise from the predesign math."""
+    return (
+        req.component_type,
+        _round_opt(req.voltage_max, 3),
+        _round_opt(req.current_max, 3),
+        _round_opt(req.inductance_min, 12),
+        _round_opt(req.capacitance_min, 12),
+    )
+
+# Campos del componente que ya van en columnas propias, no en "attributes"
+_NON_ATTRIBUTE_FIELDS = frozenset({
+    "part_number", "manufacturer", "description", "datasheet_url",
+    "product_url", "catalog", "price_usd", "availability",
+})
+
+@lru_cache(maxsize=None)
+def _attribute_fields(component_cls: type) -> Tuple[str, ...]:
+    """Per-class field names exported as agent attributes (subclasses add their own specs)."""
+    return tuple(f.name for f in dataclass_fields(component_cls) if f.name not in _NON_ATTRIBUTE_FIELDS)
+
+# Decimal or scientific notation (signed exponents included)
+_NUMBER_RE = re.compile(r"[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?\Z")
+
+def _maybe_float(raw) -> Optional[float]:
+    """Parse numeric-looking values; plain text placeholders return None without raising."""
+    if raw is None:
+        return None
+    if isinstance(raw, (int, float)):
+        return float(raw)
+    text = str(raw).strip()
+    if _NUMBER_RE.match(text) is None:
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+_COLUMN_KEYS = (
+    "col_type", "col_mfr", "col_part", "col_desc", "col_price",
+    "col_stock", "col_score", "col_datasheet", "col_link",
+)
+
+@lru_cache(maxsize=8)
+def _component_columns(lang_label: str) -> Tuple[str, ...]:
+    """Translated component table headers; translations are static per language."""
+    return tuple(get_text(key, lang_label) for key in _COLUMN_KEYS)
 
 def _create_empty_df(message: str = "", lang_label: str = "Español") -> pd.DataFrame:
     """Creates an empty DataFrame with the correct columns, optionally with a message."""
-    cols = [
-        get_text("col_type", lang_label),
-        get_text("col_mfr", lang_label),
-        get_text("col_part", lang_label),
-        get_text("col_desc", lang_label),
-        get_text("col_price", lang_label),
-        get_text("col_stock", lang_label),
-        get_text("col_score", lang_label),
-        get_text("col_datasheet", lang_label),
-        get_text("col_link", lang_label)
-    ]
-    df = pd.DataFrame(columns=cols)
-    if message:
-        # Add a row with the message in the Description column
-        row = {col: "" for col in cols}
-        row[get_text("col_desc", lang_label)] = message
-        df = pd.concat([df, pd.DataFrame([row])], ignore_index=True)
-    return df
+    cols = _component_columns(lang_label)
+    if not message:
+        return pd.DataFrame(columns=cols)
+    # Single row with the message in the Description column, built directly (no concat)
+    row = [""] * len(cols)
+    row[_DESC_IDX] = message
+    return pd.DataFrame([row], columns=cols)
+
+def _prefix_formatter(unit: str, bounds: Tuple[float, ...], steps: Tuple[Tuple[float, str], ...]):
+    """Engineering-prefix formatter: one bisect over the magnitude picks (scale, template)."""
+    def fmt(value: float) -> str:
+        if not math.isfinite(value):
+            return f"{value} {unit}"
+        scale, template = steps[bisect_right(bounds, abs(value))]
+        return template.format(value * scale)
+    return fmt
+
+_fmt_farads = _prefix_formatter("F", (1e-6, 1e-3, 1), (
+    (1e9, "{:.3f} nF"), (1e6, "{:.3f} µF"), (1e3, "{:.3f} mF"), (1, "{:.6f} F"),
+))
+_fmt_henries = _prefix_formatter("H", (1e-6, 1e-3, 1), (
+    (1e9, "{:.3f} nH"), (1e6, "{:.3f} µH"), (1e3, "{:.3f} mH"), (1, "{:.6f} H"),
+))
+_fmt_hz = _prefix_formatter("Hz", (1e3, 1e6), (
+    (1, "{:.3f} Hz"), (1e-3, "{:.3f} kHz"), (1e-6, "{:.3f} MHz"),
+))
+
+_UNIT_FORMATTERS = {
+    "F": _fmt_farads,
+    "H": _fmt_henries,
+    "Hz": _fmt_hz,
+    "%": lambda v: f"{v:.2f}%",
+}
+
+def _fmt_plain(value: float) -> str:
+    return f"{value:.4g}"
+
+def _fmt_generic(unit: str):
+    return lambda value: f"{value:.4g} {unit}"
+
+# Formateador resuelto por clave: una sola búsqueda por valor en el reporte
+_KEY_FORMATTERS = MappingProxyType({
+    key: _UNIT_FORMATTERS.get(unit) or (_fmt_generic(unit) if unit else _fmt_plain)
+    for key, unit in OUTPUT_UNITS.items()
+})
+_KEY_FMT_GET = _KEY_FORMATTERS.get
 
 def _format_value_with_unit(key: str, value: float) -> str:
     """Formatea un valor con su unidad correspondiente."""
-    unit = OUTPUT_UNITS.get(key, "")
-    if unit == "F":
-        if abs(value) < 1e-6: return f"{value*1e9:.3f} nF"
-        elif abs(value) < 1e-3: return f"{value*1e6:.3f} µF"
-        elif abs(value) < 1: return f"{value*1e3:.3f} mF"
-        else: return f"{value:.6f} F"
-    elif unit == "H":
-        if abs(value) < 1e-6: return f"{value*1e9:.3f} nH"
-        elif abs(value) < 1e-3: return f"{value*1e6:.3f} µH"
-        elif abs(value) < 1: return f"{value*1e3:.3f} mH"
-        else: return f"{value:.6f} H"
-    elif unit == "Hz":
-        if abs(value) >= 1e6: return f"{value/1e6:.3f} MHz"
-        elif abs(value) >= 1e3: return f"{value/1e3:.3f} kHz"
-        else: return f"{value:.3f} Hz"
-    elif unit == "%":
-        return f"{value:.2f}%"
-    elif unit:
-        return f"{value:.4g} {unit}"
-    else:
-        return f"{value:.4g}"
+    return _KEY_FMT_GET(key, _fmt_plain)(value)
+
+def _default_value(field: FieldDefinition) -> Optional[float]:
+    # Use default if set, otherwise try to parse placeholder as default value
+    return _maybe_float(field.default if field.default is not None else field.placeholder)
+
+def _build_forms_index():
+    """Single pass over FORMS: field keys, per-topology keys/defaults and field metadata."""
+    meta_by_key: Dict[str, FieldDefinition] = {}
+    keys_by_topology: Dict[str, Tuple[str, ...]] = {}
+    defaults_by_topology: Dict[str, Mapping[str, float]] = {}
+    for tid, form in FORMS.items():
+        form_fields = (*form.fields, *form.constraint_fields)
+        keys_by_topology[tid.value] = tuple(f.key for f in form_fields)
+        defaults = {}
+        for field in form_fields:
+            meta_by_key.setdefault(field.key, field)  # first definition wins
+            value = _default_value(field)
+            if value is not None:
+                defaults[field.key] = value
+        defaults_by_topology[tid.value] = MappingProxyType(defaults)
+    return (
+        tuple(meta_by_key),
+        MappingProxyType(keys_by_topology),
+        MappingProxyType(defaults_by_topology),
+        MappingProxyType(meta_by_key),
+    )
+
+# FORMS es inmutable en tiempo de ejecución: todo lo derivado se calcula una vez al importar
+_ALL_FIELD_KEYS, _TOPOLOGY_FIELD_KEYS, _TOPOLOGY_DEFAULTS, _FIELD_META = _build_forms_index()
+_EMPTY_DEFAULTS: Mapping[str, float] = MappingProxyType({})
+
+@lru_cache(maxsize=None)
+def _fallback_field(key: str) -> FieldDefinition:
+    """Placeholder definition for keys no form declares, built once per key."""
+    return FieldDefinition(key, key, "", "")
+
+def _first_positive(*lookups: Tuple[Mapping[str, float], Tuple[str, ...]]) -> Optional[float]:
+    """First strictly positive value over (mapping, keys) pairs, scanning in order."""
+    for source, keys in lookups:
+        get = source.get
+        for key in keys:
+            value = get(key)
+            if value is not None and value > 0:
+                return value
+    return None
+
+@lru_cache(maxsize=32)
+def _get_selector(weights_key: Tuple[Tuple[str, float], ...]) -> ComponentSelector:
+    """Selector for a given set of weights; unchanged sliders reuse the same instance."""
+    return ComponentSelector(weights=PrioritizationWeights(**dict(weights_key)))
+
+_NAME_CACHE: Dict[str, str] = {}
+
+def _pretty(key: str) -> str:
+    """Nombre legible para una clave de resultado, memorizado por clave."""
+    name = _NAME_CACHE.get(key)
+    if name is None:
+        name = _NAME_CACHE[key] = key.replace("_", " ").title()
+    return name
 
 class GradioAdapter:
     def __init__(self):
@@ -94,9 +242,15 @@ class GradioAdapter:
         self.workflow = DesignWorkflowService(factory=self.factory, validation_engine=self.validator)
         self.workflow.factory = self.factory
 
+        # Form-derived data is static; compute it once instead of on every UI event
+        forms = available_forms([info.topology_id for info in self.factory.available_topologies()])
+        self._available_topologies = [(form.title, form.topology_id.value) for form in forms]
+
         self.mouser_adapter = None
         self.component_service = None
         self.task_queue = None
+        # (id(catalog), huella del requisito) -> (expira_en, componentes)
+        self._search_cache: Dict[Tuple[Any, ...], Tuple[float, Tuple[Any, ...]]] = {}
         
         try:
             from tutor_virtual.infrastructure.task_queue import RedisTaskQueue
@@ -113,34 +267,48 @@ class GradioAdapter:
             )
             logger.info("Mouser adapter initialized successfully")
         except Exception as e:
-            logger.error(f"Mouser API not available: {e}")
+            logger.error("Mouser API not available: %s", e)
 
-    def submit_indexing_job(self, file_path: str, original_filename: str, strategy: str = "fast") -> str:
+    async def submit_indexing_job(self, file_path: str, original_filename: str, strategy: str = "fast") -> str:
         """Submit a document indexing job to the background queue."""
+        return (await self.submit_indexing_jobs([(file_path, original_filename)], strategy))[0]
+
+    async def submit_indexing_jobs(self, files: List[Tuple[str, Optional[str]]], strategy: str = "fast") -> List[str]:
+        """Submit several indexing jobs, enqueuing them in one Redis round-trip."""
         if not self.task_queue:
             raise RuntimeError("Task queue is not available (Redis not configured?)")
             
         import shutil
         import os
         from pathlib import Path
+        from uuid import uuid4
         
         # Create staging directory
         staging_dir = Path("data/uploads/staging")
         staging_dir.mkdir(parents=True, exist_ok=True)
         
-        # Copy file to staging area so worker can access it
-        staging_path = staging_dir / f"{os.path.basename(file_path)}"
-        shutil.copy2(file_path, staging_path)
+        # Copy files to staging area so worker can access them. Copies run concurrently,
+        # so each gets a unique name even when two uploads share a filename.
+        staging_paths = [staging_dir / f"{uuid4().hex}_{os.path.basename(file_path)}" for file_path, _ in files]
+        # File copies and the Redis call run off the event loop
+        await asyncio.gather(*[
+            asyncio.to_thread(shutil.copy2, file_path, staging_path)
+            for (file_path, _), staging_path in zip(files, staging_paths)
+        ])
         
-        job_id = self.task_queue.enqueue_job(
+        return await asyncio.to_thread(
+            self.task_queue.enqueue_jobs,
             "index_document",
-            {
-                "file_path": str(staging_path.absolute()),
-                "original_filename": original_filename,
-                "strategy": strategy
-            }
+            [
+                {
+                    "file_path": str(staging_path.absolute()),
+                    # The staging name carries the uuid prefix; keep the user's name for indexing
+                    "original_filename": original_filename or os.path.basename(file_path),
+                    "strategy": strategy
+                }
+                for staging_path, (file_path, original_filename) in zip(staging_paths, files)
+            ]
         )
-        return job_id
 
     def get_job_status(self, job_id: str) -> Dict[str, Any]:
         """Get status of a background job."""
@@ -148,6 +316,12 @@ class GradioAdapter:
             return {"status": "unknown"}
         return self.task_queue.get_job_status(job_id)
 
+    def get_job_statuses(self, job_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get status of several background jobs in one round-trip."""
+        if not self.task_queue:
+            return {job_id: {"status": "unknown"} for job_id in job_ids}
+        return self.task_queue.get_job_statuses(job_ids)
+
     def delete_document(self, doc_id: str) -> bool:
         """Delete a document via the RAG service."""
         from tutor_virtual.infrastructure.rag import get_rag_service
@@ -155,61 +329,33 @@ class GradioAdapter:
             service = get_rag_service()
             return service.delete_document(doc_id)
         except Exception as e:
-            logger.error(f"Error deleting document via adapter: {e}")
+            logger.error("Error deleting document via adapter: %s", e)
             return False
 
     def get_available_topologies(self) -> List[Tuple[str, str]]:
         """Returns list of (Display Name, ID) for Dropdown."""
-        forms = available_forms([info.topology_id for info in self.factory.available_topologies()])
-        return [(form.title, form.topology_id.value) for form in forms]
+        return self._available_topologies
 
-    def get_all_field_keys(self) -> List[str]:
-        """Returns a set of all unique field keys across all topologies."""
-        keys = set()
-        for form in FORMS.values():
-            for field in form.fields:
-                keys.add(field.key)
-            for field in form.constraint_fields:
-                keys.add(field.key)
-        return list(keys)
+    def get_all_field_keys(self) -> Tuple[str, ...]:
+        """Returns all unique field keys across all topologies."""
+        return _ALL_FIELD_KEYS
 
-    def get_topology_fields(self, topology_id_str: str) -> List[str]:
-        """Returns list of field keys active for a given topology."""
+    def get_topology_fields(self, topology_id_str: str) -> Tuple[str, ...]:
+        """Returns the field keys active for a given topology."""
         if not topology_id_str:
-            return []
-        try:
-            topology_id = TopologyId(topology_id_str)
-            form = FORMS.get(topology_id)
-            if not form:
-                return []
-            keys = [f.key for f in form.fields]
-            keys.extend([f.key for f in form.constraint_fields])
-            return keys
-        except ValueError:
-            return []
-
-    def get_topology_defaults(self, topology_id_str: str) -> Dict[str, float]:
+            return ()
+        return _TOPOLOGY_FIELD_KEYS.get(topology_id_str, ())
+
+    def get_topology_defaults(self, topology_id_str: str) -> Mapping[str, float]:
         """Returns default values for fields of a given topology."""
         if not topology_id_str:
-            return {}
-        try:
-            topology_id = TopologyId(topology_id_str)
-            form = FORMS.get(topology_id)
-            if not form:
-                return {}
-            defaults = {}
-            for field in list(form.fields) + list(form.constraint_fields):
-                # Use default if set, otherwise try to parse placeholder as default value
-                val_to_parse = field.default if field.default is not None else field.placeholder
-                
-                if val_to_parse is not None:
-                    try:
-                        defaults[field.key] = float(val_to_parse)
-                    except ValueError:
-                        pass
-            return defaults
-        except ValueError:
-            return {}
+            return _EMPTY_DEFAULTS
+        return _TOPOLOGY_DEFAULTS.get(topology_id_str, _EMPTY_DEFAULTS)
+
+    def get_field_meta(self, key: str) -> FieldDefinition:
+        """Returns the field definition for a key (first form that declares it)."""
+        meta = _FIELD_META.get(key)
+        return meta if meta is not None else _fallback_field(key)
 
     async def run_design(
         self, 
@@ -226,12 +372,17 @@ class GradioAdapter:
             - Dictionary with raw design result for context
         """
         if not topology_id_str:
-            return get_text("msg_select_topo", lang_label), _create_empty_df(get_text("msg_select_topo", lang_label)), None
+            msg = get_text("msg_select_topo", lang_label)
+            return msg, _create_empty_df(msg, lang_label), None
+
+        # String ids from the UI index the forms directly; no enum coercion needed
+        form = FORMS_BY_ID.get(topology_id_str)
+        if form is None:
+            msg = get_text("msg_invalid_topo", lang_label)
+            return msg, _create_empty_df(msg, lang_label), None
 
         try:
-            topology_id = TopologyId(topology_id_str)
-            form = FORMS[topology_id]
-            
+
             # Separate operating conditions and constraints
             operating = {}
             constraints = {}
@@ -246,19 +397,24 @@ class GradioAdapter:
                     constraints[field.key] = float(inputs[field.key])
 
             spec = ConverterSpec(
-                topology_id=topology_id.value,
+                topology_id=form.topology_id.value,
                 operating_conditions=operating,
                 constraints=constraints,
             )
             
             context = DesignContext(user_id="gradio-user", project_id="web-session")
-            result = self.workflow.run_predesign(DesignRequest(context=context, spec=spec))
+            # Predesign math is CPU-bound; keep the event loop free for other sessions
+            result = await asyncio.to_thread(self.workflow.run_predesign, DesignRequest(context=context, spec=spec))
             
             # Generate Report
             report = self._generate_markdown_report(result, lang_label)
             
-            # Search Components
-            components_df, components_list = await self._search_components_df(result, weights, lang_label)
+            # Search Components (skip the requirement walk entirely when the catalog is down)
+            if self.component_service is None:
+                components_df = _create_empty_df(get_text("comp_service_unavailable", lang_label), lang_label)
+                components_list = []
+            else:
+                components_df, components_list = await self._search_components_df(result, weights, lang_label)
             
             # Convert result to dict for context
             # We use a custom serialization or just extract what we need to avoid issues with Enums/complex types
@@ -275,41 +431,36 @@ class GradioAdapter:
             return report, components_df, result_context
 
         except ValidationFailedError as exc:
-            issues = "\n".join(f"- {issue.message}" for issue in exc.issues)
+            issues = "\n".join([f"- {issue.message}" for issue in exc.issues])
             title = get_text("report_error_validation", lang_label)
             return f"### ⛔ {title}\n\n{issues}", _create_empty_df(title), None
         except Exception as exc:
             logger.exception("Error running design")
             title = get_text("report_error_system", lang_label)
-            return f"### ❌ {title}\n\n{str(exc)}", _create_empty_df(title), None
+            return f"### ❌ {title}\n\n{exc}", _create_empty_df(title), None
 
     def _generate_markdown_report(self, result: DesignSessionResult, lang_label: str) -> str:
         lines = [f"# 📊 {get_text('report_title', lang_label)}"]
         
-        if result.predesign.primary_values:
+        primary_values = result.predesign.primary_values
+        if primary_values:
             lines.append(f"## ⚡ {get_text('report_params', lang_label)}")
-            for key, value in result.predesign.primary_values.items():
-                formatted = _format_value_with_unit(key, value)
-                name = key.replace("_", " ").title()
-                lines.append(f"- **{name}:** {formatted}")
+            lines.extend(f"- **{_pretty(k)}:** {_format_value_with_unit(k, v)}" for k, v in primary_values.items())
         
-        if result.losses.totals and any(result.losses.totals.values()):
+        loss_totals = result.losses.totals
+        if loss_totals and any(loss_totals.values()):
             lines.append(f"\n## 🔥 {get_text('report_losses', lang_label)}")
-            total_losses = 0
-            for key, value in result.losses.totals.items():
-                formatted = _format_value_with_unit(key, value)
-                name = key.replace("_", " ").title()
-                lines.append(f"- **{name}:** {formatted}")
-                if "loss" in key.lower():
-                    total_losses += value
+            lines.extend(f"- **{_pretty(k)}:** {_format_value_with_unit(k, v)}" for k, v in loss_totals.items())
+            total_losses = sum(value for key, value in loss_totals.items() if "loss" in key.lower())
             if total_losses > 0:
                 lines.append(f"- **{get_text('report_total_losses', lang_label)}:** {_format_value_with_unit('total_loss', total_losses)}")
 
         if result.issues:
             lines.append(f"\n## ⚠️ {get_text('report_warnings', lang_label)}")
-            for issue in result.issues:
-                icon = "🔴" if issue.severity.value == "error" else "🟡"
-                lines.append(f"- {icon} **{issue.severity.value.upper()}:** {issue.message}")
+            lines.extend(
+                f"- {'🔴' if issue.severity.value == 'error' else '🟡'} **{issue.severity.value.upper()}:** {issue.message}"
+                for issue in result.issues
+            )
         
         return "\n".join(lines)
 
@@ -321,106 +472,120 @@ class GradioAdapter:
         if not requirements_list:
             return _create_empty_df(get_text("comp_no_requirements", lang_label), lang_label), []
 
-        all_components = []
+        # Una lista por columna: el DataFrame se construye sin inferir filas
+        col_type, col_mfr, col_part, col_desc = [], [], [], []
+        col_price, col_stock, col_score, col_ds, col_link = [], [], [], [], []
         raw_components_data = []
-        prioritization = PrioritizationWeights(**weights_dict)
-        selector = ComponentSelector(weights=prioritization)
+        selector = _get_selector(tuple(sorted(weights_dict.items())))
+
+        # Query every requirement concurrently; Mouser I/O dominates the latency
+        catalogs = self.component_service.catalogs
+        search = self._cached_search
+        n_catalogs = len(catalogs)
+        results = await asyncio.gather(
+            *[search(catalog, req) for req in requirements_list for catalog in catalogs],
+            return_exceptions=True,
+        )
 
-        for req in requirements_list:
+        select_top = selector.select_top_components
+        add_raw = raw_components_data.append
+
+        for i, req in enumerate(requirements_list):
             try:
+                # Resultados en orden cartesiano: un bloque de n_catalogs por requisito
                 components = []
-                for catalog in self.component_service.catalogs:
-                    found = await catalog.search_components(requirements=req, limit=5)
+                for found in results[i * n_catalogs:(i + 1) * n_catalogs]:
+                    if isinstance(found, BaseException):
+                        # Un catálogo caído no descarta los resultados de los demás
+                        logger.error("Error searching components for %s: %s", req.component_type, found)
+                        continue
                     components.extend(found)
                 
                 if components:
-                    scored = selector.select_top_components(components, req, top_n=5)
-                    for s in scored:
+                    ct_value = req.component_type.value
+                    for s in select_top(components, req, top_n=5):
                         c = s.component
-                        # Format links as HTML for Gradio Dataframe
-                        datasheet_link = f'<a href="{c.datasheet_url}" target="_blank">PDF</a>' if c.datasheet_url else "-"
-                        view_text = get_text("link_view", lang_label)
-                        product_link = f'<a href="{c.product_url}" target="_blank">{view_text}</a>' if c.product_url else "-"
-                        
-                        all_components.append({
-                            get_text("col_type", lang_label): req.component_type.value,
-                            get_text("col_mfr", lang_label): c.manufacturer,
-                            get_text("col_part", lang_label): c.part_number,
-                            get_text("col_desc", lang_label): c.description,
-                            get_text("col_price", lang_label): c.price_usd,
-                            get_text("col_stock", lang_label): c.availability,
-                            get_text("col_score", lang_label): round(s.total_score, 2),
-                            get_text("col_datasheet", lang_label): datasheet_link,
-                            get_text("col_link", lang_label): product_link
-                        })
+                        ds = c.datasheet_url
+                        pu = c.product_url
+                        manufacturer = c.manufacturer
+                        part_number = c.part_number
+                        description = c.description
+                        col_type.append(ct_value)
+                        col_mfr.append("" if manufacturer is None else manufacturer)
+                        col_part.append("" if part_number is None else part_number)
+                        col_desc.append("" if description is None else description)
+                        col_price.append(c.price_usd)
+                        col_stock.append(c.availability)
+                        col_score.append(round(s.total_score, 2))
+                        col_ds.append(ds or None)
+                        col_link.append(pu or None)
                         
                         # Add raw data for agent
-                        # Convert dataclass to dict, excluding private fields
-                        comp_dict = asdict(c)
-                        raw_components_data.append({
-                            "type": req.component_type.value,
-                            "manufacturer": c.manufacturer,
-                            "part_number": c.part_number,
-                            "description": c.description,
-                            "datasheet_url": c.datasheet_url,
-                            "attributes": {k: v for k, v in comp_dict.items() if k not in ['part_number', 'manufacturer', 'description', 'datasheet_url', 'product_url', 'catalog', 'price_usd', 'availability']}
+                        add_raw({
+                            "type": ct_value,
+                            "manufacturer": manufacturer,
+                            "part_number": part_number,
+                            "description": description,
+                            "datasheet_url": ds,
+                            "attributes": {name: getattr(c, name) for name in _attribute_fields(type(c))}
                         })
 
             except Exception as e:
-                logger.error(f"Error searching components for {req.component_type}: {e}")
+                logger.error("Error searching components for %s: %s", req.component_type, e)
 
-        if not all_components:
+        if not col_type:
             return _create_empty_df(get_text("comp_no_requirements", lang_label), lang_label), []
 
-        df = pd.DataFrame(all_components)
-        df = df.fillna("")
+        columns = _component_columns(lang_label)
+        df = pd.DataFrame(dict(zip(columns, (
+            col_type, col_mfr, col_part, col_desc, col_price, col_stock, col_score,
+        ))))
+        # Format links as HTML for Gradio Dataframe, column-wise instead of per row
+        view_text = get_text("link_view", lang_label)
+        ds_urls = pd.Series(col_ds, dtype=object)
+        pu_urls = pd.Series(col_link, dtype=object)
+        df[columns[-2]] = ('<a href="' + ds_urls.fillna("") + '" target="_blank">PDF</a>').where(ds_urls.notna(), "-")
+        df[columns[-1]] = ('<a href="' + pu_urls.fillna("") + f'" target="_blank">{view_text}</a>').where(pu_urls.notna(), "-")
         return df, raw_components_data
 
+    async def _cached_search(self, catalog, req: ComponentRequirements) -> Tuple[Any, ...]:
+        """Search a catalog, reusing recent results for equivalent requirements."""
+        key = (id(catalog), _requirements_fingerprint(req))
+        now = time.monotonic()
+        cached = self._search_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        components = tuple(await catalog.search_components(requirements=req, limit=5))
+        self._search_cache.pop(key, None)
+        if len(self._search_cache) >= _SEARCH_CACHE_SIZE:
+            # Descarta la entrada más antigua (los dict conservan el orden de inserción)
+            del self._search_cache[next(iter(self._search_cache))]
+        self._search_cache[key] = (now + _SEARCH_CACHE_TTL, components)
+        return components
+
     def _extract_component_requirements(self, result: DesignSessionResult) -> List[ComponentRequirements]:
         # Logic copied and adapted from app.py
-        requirements_list = []
+        topology = _TID.get(result.spec.topology_id)
+        component_types = _TOPO_COMPONENTS.get(topology, ())
         primary = result.predesign.primary_values
-        topology = TopologyId(result.spec.topology_id)
-        
-        topology_components = {
-            TopologyId.DC_DC_BUCK: [ComponentType.MOSFET, ComponentType.DIODE, ComponentType.INDUCTOR, ComponentType.CAPACITOR],
-            TopologyId.DC_DC_BOOST: [ComponentType.MOSFET, ComponentType.DIODE, ComponentType.INDUCTOR, ComponentType.CAPACITOR],
-            TopologyId.DC_DC_BUCK_BOOST: [ComponentType.MOSFET, ComponentType.DIODE, ComponentType.INDUCTOR, ComponentType.CAPACITOR],
-            TopologyId.DC_DC_CUK: [ComponentType.MOSFET, ComponentType.DIODE, ComponentType.INDUCTOR, ComponentType.CAPACITOR],
-            TopologyId.DC_DC_FLYBACK: [ComponentType.MOSFET, ComponentType.DIODE, ComponentType.CAPACITOR],
-            TopologyId.AC_DC_RECTIFIER_SINGLE: [ComponentType.DIODE, ComponentType.CAPACITOR],
-            TopologyId.AC_DC_RECTIFIER_FULL: [ComponentType.DIODE, ComponentType.CAPACITOR],
-            TopologyId.DC_AC_HALF_BRIDGE: [ComponentType.MOSFET, ComponentType.CAPACITOR],
-            TopologyId.DC_AC_FULL_BRIDGE_SINGLE: [ComponentType.MOSFET, ComponentType.CAPACITOR],
-            TopologyId.DC_AC_FULL_BRIDGE_THREE: [ComponentType.MOSFET, ComponentType.CAPACITOR],
-        }
-        
-        component_types = topology_components.get(topology, [])
         operating = result.spec.operating_conditions
         
-        voltage_max = (
-            operating.get("vin") or operating.get("vdc") or operating.get("vin_max") or
-            primary.get("vin") or primary.get("vdc") or primary.get("vo_avg") or primary.get("vac_rms", 0)
-        )
-        if voltage_max: voltage_max *= 1.5
+        voltage_max = _first_positive((operating, ("vin", "vdc", "vin_max")), (primary, ("vin", "vdc", "vo_avg", "vac_rms")))
+        if voltage_max is not None: voltage_max *= 1.5
         
-        current_max = (
-            operating.get("io_max") or operating.get("io") or
-            primary.get("io_max") or primary.get("il_avg") or primary.get("io_avg") or primary.get("i_l_rms", 0)
-        )
-        if current_max: current_max *= 1.2
+        current_max = _first_positive((operating, ("io_max", "io")), (primary, ("io_max", "il_avg", "io_avg", "i_l_rms")))
+        if current_max is not None: current_max *= 1.2
         
-        inductance = primary.get("inductance") or primary.get("l_min")
-        capacitance = primary.get("capacitance") or primary.get("c_min") or primary.get("required_capacitance")
+        inductance = _first_positive((primary, ("inductance", "l_min")))
+        capacitance = _first_positive((primary, ("capacitance", "c_min", "required_capacitance")))
         
-        for comp_type in component_types:
-            req = ComponentRequirements(
+        return [
+            ComponentRequirements(
                 component_type=comp_type,
-                voltage_max=voltage_max if voltage_max else None,
-                current_max=current_max if current_max else None,
-                inductance_min=inductance if comp_type == ComponentType.INDUCTOR and inductance else None,
-                capacitance_min=capacitance if comp_type == ComponentType.CAPACITOR and capacitance else None,
+                voltage_max=voltage_max,
+                current_max=current_max,
+                inductance_min=inductance if comp_type == ComponentType.INDUCTOR else None,
+                capacitance_min=capacitance if comp_type == ComponentType.CAPACITOR else None,
             )
-            requirements_list.append(req)
-            
-        return requirements_list
+            for comp_type in component_types
+        ]
@@ -1,43 +1,118 @@
 """Gradio-based web interface for the AI Power Converter Designer."""
 
+import asyncio
 import logging
+import threading
+import time
 import gradio as gr
-import pandas as pd
 from typing import List
+from uuid import uuid4
 from .gradio_adapter import GradioAdapter
-from .spec_schema import FORMS, FieldDefinition
 
 logger = logging.getLogger(__name__)
 
 # Initialize adapter
 adapter = GradioAdapter()
 
+HIDDEN_FIELD_KWARGS = {"visible": False, "value": 0}  # label is refreshed when the field is shown
+DOCS_REFRESH_INTERVAL = 5.0  # seconds between background documents snapshot refreshes
+MAX_DOCS_UI = 200  # rows sent to the documents table unless "show all" is used
+STREAM_MIN_INTERVAL = 0.025  # flush buffered chat tokens after this much quiet time
+STREAM_MAX_PENDING_CHARS = 32  # flush earlier if this much text is buffered
+QUEUE_CONCURRENCY = 16  # workers per concurrency group (calc, default)
+CHAT_CONCURRENCY = 32  # chat streams are I/O-bound waits on the LLM
+QUEUE_MAX_SIZE = 64
+
+
+_tutor_service = None
+_tutor_service_loaded = False
+_tutor_service_lock = threading.Lock()
+
+
+def get_tutor_service():
+    """Build the TutorService on first use; its ML dependencies are slow to import."""
+    global _tutor_service, _tutor_service_loaded
+    if _tutor_service_loaded:
+        return _tutor_service
+    with _tutor_service_lock:
+        if not _tutor_service_loaded:
+            try:
+                from tutor_virtual.application.tutor_service import TutorService
+                _tutor_service = TutorService()
+                logger.info("Tutor Service initialized successfully")
+            except Exception as e:
+                logger.error(f"Tutor Service failed to initialize: {e}")
+                _tutor_service = None
+            _tutor_service_loaded = True
+    return _tutor_service
+
+
+async def coalesce_stream(tokens, max_delay=STREAM_MIN_INTERVAL, max_chars=STREAM_MAX_PENDING_CHARS):
+    """Merge streamed tokens into chunks, flushing on size or after a short quiet period.
+
+    The pending ``__anext__`` is awaited via ``asyncio.wait`` (not ``wait_for``) so a
+    timeout never cancels the underlying generator mid-token.
+    """
+    iterator = tokens.__aiter__()
+    buffer = []
+    size = 0
+    pending = asyncio.ensure_future(iterator.__anext__())
+    try:
+        while True:
+            done, _ = await asyncio.wait({pending}, timeout=max_delay if buffer else None)
+            if not done:
+                yield "".join(buffer)
+                buffer.clear()
+                size = 0
+                continue
+            try:
+                token = pending.result()
+            except StopAsyncIteration:
+                break
+            buffer.append(token)
+            size += len(token)
+            pending = asyncio.ensure_future(iterator.__anext__())
+            if size >= max_chars:
+                yield "".join(buffer)
+                buffer.clear()
+                size = 0
+    finally:
+        if not pending.done():
+            pending.cancel()
+    if buffer:
+        yield "".join(buffer)
+
+
+def new_session_id(_uuid4=uuid4) -> str:
+    """Default for the per-connection session id state."""
+    return str(_uuid4())
+
+COMPONENT_HEADER_KEYS = (
+    "col_type", "col_mfr", "col_part", "col_desc", "col_price",
+    "col_stock", "col_score", "col_datasheet", "col_link",
+)
+DOCS_HEADER_KEYS = ("docs_col_id", "docs_col_filename", "docs_col_chunks", "docs_col_indexed")
+EXAMPLE_KEYS = ("ex_buck", "ex_inductor", "ex_diff", "ex_freq")
+
 def create_app():
     # Get available topologies
     topologies = adapter.get_available_topologies() # List of (Key, ID)
+    # Static per-topology field sets and defaults, resolved once at startup
+    topo_active = {tid: frozenset(adapter.get_topology_fields(tid)) for _, tid in topologies}
+    topo_defaults = {tid: adapter.get_topology_defaults(tid) for _, tid in topologies}
     
     # Get all possible field keys to create widgets
     all_field_keys = adapter.get_all_field_keys()
+    field_index = {key: i for i, key in enumerate(all_field_keys)}
     
-    # Helper to get field metadata
-    def get_field_meta(key: str) -> FieldDefinition:
-        for form in FORMS.values():
-            for f in list(form.fields) + list(form.constraint_fields):
-                if f.key == key:
-                    return f
-        return FieldDefinition(key, key, "", "")
-
-    # Initialize Tutor Service
-    from tutor_virtual.application.tutor_service import TutorService
-    try:
-        tutor_service = TutorService()
-        logger.info("Tutor Service initialized successfully")
-    except Exception as e:
-        logger.error(f"Tutor Service failed to initialize: {e}")
-        tutor_service = None
+    # (label key, unit) per field, extracted once for the label-building loops
+    field_info = {
+        key: (meta.label, meta.unit)
+        for key, meta in ((key, adapter.get_field_meta(key)) for key in all_field_keys)
+    }
 
     # Initialize I18n helpers
-    from .translations import get_text, LANG_MAP
+    from .translations import format_text, get_text, LANG_MAP
 
     # Initial Topology Choices (Español default)
     def get_topology_choices(lang_label="Español"):
@@ -45,19 +120,34 @@ def create_app():
 
     initial_choices = get_topology_choices()
 
-    import uuid
-    
-    async def chat_response(message, history, session_id):
-        if not tutor_service:
-            return "⚠️ Service unavailable."
-        return await tutor_service.ask_question(message, session_id=session_id)
+    # Table headers and chat examples per language, translated once
+    header_cache = {}
+
+    def _translated(keys, lang_label):
+        cached = header_cache.get((keys, lang_label))
+        if cached is None:
+            cached = header_cache[(keys, lang_label)] = [get_text(k, lang_label) for k in keys]
+        return cached
+
+    def component_headers(lang_label):
+        return _translated(COMPONENT_HEADER_KEYS, lang_label)
+
+    def docs_headers(lang_label):
+        return _translated(DOCS_HEADER_KEYS, lang_label)
+
+    def example_samples(lang_label):
+        return [[text] for text in _translated(EXAMPLE_KEYS, lang_label)]
+
+    def field_label(key, lang_label):
+        label_key, unit = field_info[key]
+        label_text = get_text(label_key, lang_label)
+        return f"{label_text} ({unit})" if unit else label_text
 
     with gr.Blocks(title="AI Power Converter Designer") as demo:
         demo.theme = gr.themes.Soft()
         
         # State for language
         lang_state = gr.State(value="Español")
-        chat_history = gr.State(value=[])
         
         # Header with Language Selector
         with gr.Row():
@@ -97,18 +187,12 @@ def create_app():
                         
                         # Determine initial active keys and defaults
                         initial_topo_id = initial_choices[0][1] if initial_choices else None
-                        initial_active_keys = set()
-                        initial_defaults = {}
-                        
-                        if initial_topo_id:
-                            initial_active_keys = set(adapter.get_topology_fields(initial_topo_id))
-                            initial_defaults = adapter.get_topology_defaults(initial_topo_id)
+                        initial_active_keys = topo_active.get(initial_topo_id, frozenset())
+                        initial_defaults = topo_defaults.get(initial_topo_id, {})
 
                         # Create all widgets
                         for key in all_field_keys:
-                            meta = get_field_meta(key)
-                            label_text = get_text(meta.label, "Español")
-                            label = f"{label_text} ({meta.unit})" if meta.unit else label_text
+                            label = field_label(key, "Español")
                             
                             # Determine initial value and visibility
                             is_visible = key in initial_active_keys
@@ -120,6 +204,7 @@ def create_app():
                                 interactive=True,
                                 visible=is_visible
                             )
+                        input_widget_list = [input_widgets[key] for key in all_field_keys]
                         
                         # Prioritization Weights
                         weights_header_md = gr.Markdown(get_text("weights_header", "Español"))
@@ -141,13 +226,7 @@ def create_app():
                         
                         catalog_header_md = gr.Markdown(get_text("catalog_header", "Español"))
                         components_df = gr.Dataframe(
-                            headers=[
-                                get_text("col_type", "Español"), get_text("col_mfr", "Español"), 
-                                get_text("col_part", "Español"), get_text("col_desc", "Español"), 
-                                get_text("col_price", "Español"), get_text("col_stock", "Español"), 
-                                get_text("col_score", "Español"), get_text("col_datasheet", "Español"), 
-                                get_text("col_link", "Español")
-                            ],
+                            headers=component_headers("Español"),
                             datatype=["str", "str", "str", "str", "number", "number", "str", "html", "html"],
                             interactive=False,
                             wrap=True
@@ -160,7 +239,7 @@ def create_app():
                 
                 chatbot = gr.Chatbot(
                     label=get_text("tab_tutor", "Español"),
-                    value=chat_history.value, # Load history
+                    value=[],
                     latex_delimiters=[
                         {"left": "$$", "right": "$$", "display": True},
                         {"left": "$", "right": "$", "display": False},
@@ -182,12 +261,7 @@ def create_app():
                 clear_btn = gr.ClearButton([msg, chatbot], value="Clear Chat")
                 
                 # Examples using Dataset for dynamic updates
-                examples_data = [
-                    [get_text("ex_buck", "Español")],
-                    [get_text("ex_inductor", "Español")],
-                    [get_text("ex_diff", "Español")],
-                    [get_text("ex_freq", "Español")]
-                ]
+                examples_data = example_samples("Español")
                 
                 examples_dataset = gr.Dataset(
                     label="Examples",
@@ -224,18 +298,15 @@ def create_app():
                     with gr.Column(scale=2):
                         docs_list_header_md = gr.Markdown(get_text("docs_list_header", "Español"))
                         docs_list = gr.Dataframe(
-                            headers=[
-                                get_text("docs_col_id", "Español"),
-                                get_text("docs_col_filename", "Español"),
-                                get_text("docs_col_chunks", "Español"),
-                                get_text("docs_col_indexed", "Español")
-                            ],
+                            headers=docs_headers("Español"),
                             datatype=["str", "str", "number", "str"],
                             interactive=False,
                             wrap=True,
                             value=[]
                         )
-                        refresh_docs_btn = gr.Button(get_text("docs_refresh_btn", "Español"), size="sm")
+                        with gr.Row():
+                            refresh_docs_btn = gr.Button(get_text("docs_refresh_btn", "Español"), size="sm")
+                            show_all_docs_btn = gr.Button(get_text("docs_show_all_btn", "Español"), size="sm")
                         
                         # Delete controls
                         with gr.Row():
@@ -251,70 +322,61 @@ def create_app():
         # --- Logic ---
 
         # 1. Update Language
-        def update_language(lang_label):
-            new_examples = [
-                [get_text("ex_buck", lang_label)],
-                [get_text("ex_inductor", lang_label)],
-                [get_text("ex_diff", lang_label)],
-                [get_text("ex_freq", lang_label)]
-            ]
-            
+        def language_update_specs(lang_label):
+            """gr.update kwargs for every language-dependent output; translations are static."""
             # Update Topology Choices
             new_topo_choices = get_topology_choices(lang_label)
             
-            updates = [
-                gr.update(value=get_text("main_header", lang_label)),
-                gr.update(label=get_text("tab_designer", lang_label)),
-                gr.update(value=get_text("designer_intro", lang_label)),
-                gr.update(value=get_text("config_header", lang_label)),
-                gr.update(label=get_text("topology_label", lang_label), choices=new_topo_choices),
-                gr.update(value=get_text("params_header", lang_label)),
-                gr.update(value=get_text("weights_header", lang_label)),
-                gr.update(label=get_text("weight_cost", lang_label)),
-                gr.update(label=get_text("weight_availability", lang_label)),
-                gr.update(label=get_text("weight_efficiency", lang_label)),
-                gr.update(label=get_text("weight_thermal", lang_label)),
-                gr.update(value=get_text("calc_button", lang_label)),
-                gr.update(value=get_text("report_header", lang_label)),
-                gr.update(value=get_text("report_placeholder", lang_label)), # Reset placeholder? Maybe not if result exists.
-                gr.update(value=get_text("catalog_header", lang_label)),
-                gr.update(headers=[
-                    get_text("col_type", lang_label), get_text("col_mfr", lang_label), 
-                    get_text("col_part", lang_label), get_text("col_desc", lang_label), 
-                    get_text("col_price", lang_label), get_text("col_stock", lang_label), 
-                    get_text("col_score", lang_label), get_text("col_datasheet", lang_label), 
-                    get_text("col_link", lang_label)
-                ], value=None), # Force refresh with new headers
-                gr.update(label=get_text("tab_tutor", lang_label)),
-                gr.update(value=get_text("tutor_header", lang_label)),
-                gr.update(value=get_text("tutor_intro", lang_label)),
-                gr.update(label=get_text("tab_tutor", lang_label)),
-                gr.update(samples=new_examples),
+            specs = [
+                dict(value=get_text("main_header", lang_label)),
+                dict(label=get_text("tab_designer", lang_label)),
+                dict(value=get_text("designer_intro", lang_label)),
+                dict(value=get_text("config_header", lang_label)),
+                dict(label=get_text("topology_label", lang_label), choices=new_topo_choices),
+                dict(value=get_text("params_header", lang_label)),
+                dict(value=get_text("weights_header", lang_label)),
+                dict(label=get_text("weight_cost", lang_label)),
+                dict(label=get_text("weight_availability", lang_label)),
+                dict(label=get_text("weight_efficiency", lang_label)),
+                dict(label=get_text("weight_thermal", lang_label)),
+                dict(value=get_text("calc_button", lang_label)),
+                dict(value=get_text("report_header", lang_label)),
+                dict(value=get_text("report_placeholder", lang_label)), # Reset placeholder? Maybe not if result exists.
+                dict(value=get_text("catalog_header", lang_label)),
+                dict(headers=component_headers(lang_label), value=None), # Force refresh with new headers
+                dict(label=get_text("tab_tutor", lang_label)),
+                dict(value=get_text("tutor_header", lang_label)),
+                dict(value=get_text("tutor_intro", lang_label)),
+                dict(label=get_text("tab_tutor", lang_label)),
+                dict(samples=example_samples(lang_label)),
                 # Documents tab
-                gr.update(label=get_text("tab_documents", lang_label)),
-                gr.update(value=get_text("docs_header", lang_label)),
-                gr.update(value=get_text("docs_intro", lang_label)),
-                gr.update(label=get_text("docs_upload_label", lang_label)),
-                gr.update(value=get_text("docs_list_header", lang_label)),
-                gr.update(headers=[
-                    get_text("docs_col_id", lang_label),
-                    get_text("docs_col_filename", lang_label),
-                    get_text("docs_col_chunks", lang_label),
-                    get_text("docs_col_indexed", lang_label)
-                ], value=None),  # Force refresh with new headers
-                gr.update(value=get_text("docs_refresh_btn", lang_label)),
-                gr.update(label=get_text("docs_delete_label", lang_label)),
-                gr.update(value=get_text("docs_delete_btn", lang_label)),
+                dict(label=get_text("tab_documents", lang_label)),
+                dict(value=get_text("docs_header", lang_label)),
+                dict(value=get_text("docs_intro", lang_label)),
+                dict(label=get_text("docs_upload_label", lang_label)),
+                dict(value=get_text("docs_list_header", lang_label)),
+                dict(headers=docs_headers(lang_label), value=None),  # Force refresh with new headers
+                dict(value=get_text("docs_refresh_btn", lang_label)),
+                dict(label=get_text("docs_delete_label", lang_label)),
+                dict(value=get_text("docs_delete_btn", lang_label)),
+                dict(value=get_text("docs_show_all_btn", lang_label)),
             ]
             
             # Update Input Widget Labels
-            for key in all_field_keys:
-                meta = get_field_meta(key)
-                label_text = get_text(meta.label, lang_label)
-                label = f"{label_text} ({meta.unit})" if meta.unit else label_text
-                updates.append(gr.update(label=label))
+            specs.extend(dict(label=field_label(key, lang_label)) for key in all_field_keys)
                 
-            return updates
+            return tuple(specs)
+
+        # Templates for every supported language, built once at startup
+        lang_update_specs = {lang: language_update_specs(lang) for lang in LANG_MAP}
+
+        def update_language(lang_label):
+            # Fresh update objects per event; the kwargs behind them are shared templates
+            specs = lang_update_specs.get(lang_label)
+            if specs is None:
+                specs = language_update_specs(lang_label)
+            upd = gr.update
+            return [upd(**spec) for spec in specs]
 
         # List of components to update
         lang_outputs = [
@@ -324,8 +386,8 @@ def create_app():
             tab_tutor, tutor_header_md, tutor_intro_md, chatbot, examples_dataset,
             # Documents tab
             tab_documents, docs_header_md, docs_intro_md, file_upload, docs_list_header_md,
-            docs_list, refresh_docs_btn, delete_dropdown, delete_btn
-        ] + [input_widgets[key] for key in all_field_keys]
+            docs_list, refresh_docs_btn, delete_dropdown, delete_btn, show_all_docs_btn
+        ] + input_widget_list
         
         lang_dropdown.change(
             fn=update_language,
@@ -344,29 +406,28 @@ def create_app():
         )
 
         # 2. Update UI Visibility (Topology)
+        # Static per (topology, language): the gr.update kwargs for every input widget
+        visibility_table = {}
+        for _, tid in topologies:
+            active_keys = topo_active[tid]
+            defaults = topo_defaults[tid]
+            for lang_label in LANG_MAP:
+                visibility_table[(tid, lang_label)] = tuple(
+                    dict(visible=True, value=defaults.get(key, 0), label=field_label(key, lang_label))
+                    if key in active_keys else HIDDEN_FIELD_KWARGS
+                    for key in all_field_keys
+                )
+
         def update_ui_visibility(topo_id_val, lang_label):
-            if not topo_id_val:
-                return [gr.update(visible=False)] * len(all_field_keys)
-            
             # topo_id_val is already the ID because Dropdown type="value"
-            active_keys = set(adapter.get_topology_fields(topo_id_val))
-            defaults = adapter.get_topology_defaults(topo_id_val)
-            
-            updates = []
-            for key in all_field_keys:
-                is_visible = key in active_keys
-                val = defaults.get(key, 0) if is_visible else 0
-                
-                # Update label based on current language
-                meta = get_field_meta(key)
-                label_text = get_text(meta.label, lang_label)
-                label = f"{label_text} ({meta.unit})" if meta.unit else label_text
-                
-                updates.append(gr.update(visible=is_visible, value=val, label=label))
-            return updates
+            # Gradio consumes update dicts in place, so only the kwargs are shared;
+            # every widget gets its own freshly built update
+            upd = gr.update
+            rows = visibility_table.get((topo_id_val, lang_label))
+            if rows is None:
+                return [upd(**HIDDEN_FIELD_KWARGS) for _ in all_field_keys]
+            return [upd(**kwargs) for kwargs in rows]
 
-        input_widget_list = [input_widgets[key] for key in all_field_keys]
-        
         topology_dropdown.change(
             fn=update_ui_visibility,
             inputs=[topology_dropdown, lang_dropdown],
@@ -378,11 +439,13 @@ def create_app():
         design_state = gr.State(value=None)
 
         async def run_calc_wrapper(topo_id_val, wc, wa, we, wt, lang_label, *values):
-            # Wrapper to handle i18n messages
-            if not topo_id_val:
-                return get_text("msg_select_topo", lang_label), pd.DataFrame(), None
-            
-            inputs_dict = {k: v for k, v in zip(all_field_keys, values) if v is not None}
+            # Only forward the active topology's fields, read by their widget position.
+            # A missing topology is answered by adapter.run_design with the localized message.
+            inputs_dict = {}
+            for key in topo_active.get(topo_id_val, ()):
+                value = values[field_index[key]]
+                if value is not None:
+                    inputs_dict[key] = value
             weights = {"cost": wc, "availability": wa, "efficiency": we, "thermal": wt}
             
             return await adapter.run_design(topo_id_val, inputs_dict, weights, lang_label)
@@ -390,15 +453,19 @@ def create_app():
         btn_calc.click(
             fn=run_calc_wrapper,
             inputs=[topology_dropdown, w_cost, w_avail, w_eff, w_therm, lang_dropdown] + input_widget_list,
-            outputs=[result_md, components_df, design_state]
+            outputs=[result_md, components_df, design_state],
+            concurrency_id="calc"
         )
 
         # Session ID State
-        session_id_state = gr.State(lambda: str(uuid.uuid4()))
+        session_id_state = gr.State(new_session_id)
 
         # Listener to update tutor context
         async def sync_design_to_tutor(design_data, session_id, lang_label):
-            if design_data and tutor_service:
+            if not design_data:
+                return None
+            tutor_service = await asyncio.to_thread(get_tutor_service)
+            if tutor_service:
                 await tutor_service.update_context(session_id, design_data)
                 gr.Info(get_text("msg_tutor_context_updated", lang_label))
             return None
@@ -415,6 +482,7 @@ def create_app():
                 yield "", history
                 return
             
+            tutor_service = await asyncio.to_thread(get_tutor_service)
             if not tutor_service:
                 history.append({"role": "user", "content": message})
                 history.append({"role": "assistant", "content": "⚠️ Service unavailable."})
@@ -425,23 +493,23 @@ def create_app():
             history.append({"role": "user", "content": message})
             yield "", history
             
-            # Stream response token by token
-            partial_message = ""
-            async for token in tutor_service.ask_question_stream(message, session_id):
-                partial_message += token
-                # Update history with partial response
-                history_with_streaming = history + [{"role": "assistant", "content": partial_message}]
-                yield "", history_with_streaming
+            # Stream response in coalesced chunks, mutating one assistant slot
+            assistant = {"role": "assistant", "content": ""}
+            history.append(assistant)
+            parts = []
+            async for chunk in coalesce_stream(tutor_service.ask_question_stream(message, session_id)):
+                parts.append(chunk)
+                assistant["content"] = "".join(parts)
+                yield "", history
             
             # Finalize with complete message in history
-            history.append({"role": "assistant", "content": partial_message})
             yield "", history
 
-        msg.submit(respond, [msg, chatbot, session_id_state], [msg, chatbot])
-        submit_btn.click(respond, [msg, chatbot, session_id_state], [msg, chatbot])
-        
-        # Sync history state
-        chatbot.change(lambda x: x, chatbot, chat_history)
+        # Chat shares one worker pool so long streams don't starve design calculations
+        msg.submit(respond, [msg, chatbot, session_id_state], [msg, chatbot],
+                   concurrency_id="chat", concurrency_limit=CHAT_CONCURRENCY)
+        submit_btn.click(respond, [msg, chatbot, session_id_state], [msg, chatbot],
+                         concurrency_id="chat", concurrency_limit=CHAT_CONCURRENCY)
 
         # 5. Document Upload & Management Logic
         def get_documents_data():
@@ -454,111 +522,161 @@ def create_app():
                 logger.error(f"Error getting documents list: {e}")
                 return []
 
-        def refresh_all_docs_ui():
-            """Refresh both the dataframe and the delete dropdown."""
-            docs = get_documents_data()
-            
-            # Format for Dataframe
-            df_data = []
-            if docs:
-                df_data = [[d["doc_id"][:8], d["filename"], d["chunk_count"], d["indexed_at"][:19]] for d in docs]
-            
-            # Format for Dropdown
-            dropdown_choices = []
-            if docs:
-                dropdown_choices = [f"{d['filename']} ({d['doc_id']})" for d in docs]
+        # Formatted document rows shared by every session; a background task keeps it fresh
+        docs_cache = {"ts": 0.0, "sig": None, "df_data": [], "choices": [], "task": None}
+
+        def invalidate_docs_cache():
+            docs_cache["ts"] = 0.0
+
+        def docs_view(limit=MAX_DOCS_UI):
+            """Cached rows/choices capped to ``limit`` so the payload stays bounded."""
+            if limit is None:
+                return docs_cache["df_data"], gr.update(choices=docs_cache["choices"])
+            return docs_cache["df_data"][:limit], gr.update(choices=docs_cache["choices"][:limit])
+
+        async def rebuild_docs_snapshot():
+            """Re-read the indexed documents and swap in new rows if the set changed."""
+            # The RAG metadata read is blocking I/O; keep it off the event loop
+            docs = await asyncio.to_thread(get_documents_data)
             
-            return df_data, gr.update(choices=dropdown_choices)
+            # Rebuild rows only when the document set looks different
+            sig = (len(docs), docs[-1]["indexed_at"] if docs else None)
+            if sig != docs_cache["sig"]:
+                # Dataframe rows and dropdown choices in one pass over docs
+                df_data, dropdown_choices = [], []
+                for d in docs:
+                    doc_id = d["doc_id"]
+                    filename = d["filename"]
+                    df_data.append([doc_id[:8], filename, d["chunk_count"], d["indexed_at"][:19]])
+                    dropdown_choices.append(f"{filename} ({doc_id})")
+                docs_cache["df_data"] = df_data
+                docs_cache["choices"] = dropdown_choices
+                docs_cache["sig"] = sig
+            docs_cache["ts"] = time.monotonic()
+
+        async def docs_refresher():
+            """Single background producer for the documents snapshot."""
+            while True:
+                await asyncio.sleep(DOCS_REFRESH_INTERVAL)
+                try:
+                    await rebuild_docs_snapshot()
+                except Exception as e:
+                    logger.error(f"Error refreshing documents snapshot: {e}")
+
+        def ensure_docs_refresher():
+            # Started lazily: create_app runs before Gradio's event loop exists
+            task = docs_cache["task"]
+            if task is None or task.done():
+                docs_cache["task"] = asyncio.get_running_loop().create_task(docs_refresher())
+
+        async def refresh_all_docs_ui(limit=MAX_DOCS_UI):
+            """Serve the documents snapshot; only read the index if it was never loaded or was invalidated."""
+            ensure_docs_refresher()
+            if not docs_cache["ts"]:
+                await rebuild_docs_snapshot()
+            return docs_view(limit)
+
+        async def force_refresh_docs_ui():
+            """Manual refresh: re-read the index now instead of waiting for the next background pass."""
+            await rebuild_docs_snapshot()
+            return docs_view()
+
+        async def show_all_docs_ui():
+            return await refresh_all_docs_ui(limit=None)
 
         # State for tracking background jobs
         active_jobs = gr.State([])
 
-        def upload_document(files, strategy, lang_label, current_jobs):
+        async def upload_document(files, strategy, lang_label, current_jobs):
             """Handle document upload via background job."""
+            # Submitting jobs doesn't change the indexed set yet; serve the current snapshot
             if not files:
-                df_data, _ = refresh_all_docs_ui()
-                return get_text("docs_no_documents", lang_label), df_data, current_jobs
+                df_data, _ = docs_view()
+                return get_text("docs_no_documents", lang_label), df_data, current_jobs, gr.Timer(active=bool(current_jobs))
             
             if not isinstance(files, list):
                 files = [files]
 
             try:
-                job_ids = []
-                for file in files:
-                    orig_name = file.orig_name if hasattr(file, 'orig_name') else None
-                    job_id = adapter.submit_indexing_job(file.name, orig_name, strategy)
-                    job_ids.append(job_id)
+                job_ids = await adapter.submit_indexing_jobs(
+                    [(file.name, getattr(file, 'orig_name', None)) for file in files], strategy
+                )
                 
-                msg = get_text("docs_upload_started", lang_label).format(count=len(job_ids), strategy=strategy)
+                msg = format_text("docs_upload_started", lang_label, count=len(job_ids), strategy=strategy)
                 gr.Info(msg)
                 
-                df_data, _ = refresh_all_docs_ui()
+                df_data, _ = docs_view()
                 updated_jobs = current_jobs + job_ids
-                return msg, df_data, updated_jobs
+                # Start polling only now that there is something to wait for
+                return msg, df_data, updated_jobs, gr.Timer(active=bool(updated_jobs))
                 
             except Exception as e:
                 logger.error(f"Error submitting jobs: {e}")
                 err_msg = f"Error: {str(e)}"
                 gr.Error(err_msg)
-                df_data, _ = refresh_all_docs_ui()
-                return err_msg, df_data, current_jobs
+                df_data, _ = docs_view()
+                return err_msg, df_data, current_jobs, gr.Timer(active=bool(current_jobs))
         
         def poll_jobs(current_jobs, lang_label):
-            """Check status of active jobs and notify user."""
+            """Check status of active jobs and notify user; stops the timer once none remain."""
             if not current_jobs:
-                return current_jobs
+                return current_jobs, gr.Timer(active=False)
             
             remaining_jobs = []
+            statuses = adapter.get_job_statuses(current_jobs)
             for job_id in current_jobs:
-                status_data = adapter.get_job_status(job_id)
+                status_data = statuses[job_id]
                 status = status_data.get("status")
                 
                 if status == "completed":
                     # Job finished successfully
                     filename = status_data.get("result", {}).get("filename", "Document")
-                    gr.Info(get_text("docs_job_completed", lang_label).format(filename=filename))
+                    gr.Info(format_text("docs_job_completed", lang_label, filename=filename))
+                    invalidate_docs_cache()
                     # Don't add to remaining_jobs
                 elif status == "failed":
                     # Job failed
                     error = status_data.get("error", "Unknown error")
-                    gr.Error(get_text("docs_job_failed", lang_label).format(error=error))
+                    gr.Error(format_text("docs_job_failed", lang_label, error=error))
+                    invalidate_docs_cache()
                     # Don't add to remaining_jobs
                 else:
                     # Still running (queued, processing)
                     remaining_jobs.append(job_id)
             
-            return remaining_jobs
+            return remaining_jobs, gr.Timer(active=bool(remaining_jobs))
 
-        def handle_delete(selection, lang_label):
+        async def handle_delete(selection, lang_label):
             """Handle document deletion."""
             if not selection:
-                return get_text("docs_select_none", lang_label), *refresh_all_docs_ui()
+                return get_text("docs_select_none", lang_label), *(await refresh_all_docs_ui())
             
             try:
                 # Extract ID from "Filename (ID)" format
                 doc_id = selection.split("(")[-1].strip(")")
                 
-                success = adapter.delete_document(doc_id)
+                success = await asyncio.to_thread(adapter.delete_document, doc_id)
                 
                 if success:
-                    msg = get_text("docs_delete_success", lang_label).format(doc_id=doc_id)
+                    invalidate_docs_cache()
+                    msg = format_text("docs_delete_success", lang_label, doc_id=doc_id)
                     gr.Info(msg)
                 else:
-                    msg = get_text("docs_delete_error", lang_label).format(doc_id=doc_id)
+                    msg = format_text("docs_delete_error", lang_label, doc_id=doc_id)
                     gr.Error(msg)
                 
-                return msg, *refresh_all_docs_ui()
+                return msg, *(await refresh_all_docs_ui())
                 
             except Exception as e:
                 logger.error(f"Error deleting document: {e}")
-                return f"Error: {str(e)}", *refresh_all_docs_ui()
+                return f"Error: {str(e)}", *(await refresh_all_docs_ui())
 
-        # Timer to auto-refresh document list every 10 seconds
-        refresh_timer = gr.Timer(10)
+        # Polls jobs and refreshes the document list every 10 seconds, only while uploads are in flight
+        refresh_timer = gr.Timer(10, active=False)
         refresh_timer.tick(
             fn=poll_jobs,
             inputs=[active_jobs, lang_dropdown],
-            outputs=[active_jobs]
+            outputs=[active_jobs, refresh_timer]
         ).then(
             fn=refresh_all_docs_ui,
             outputs=[docs_list, delete_dropdown]
@@ -567,11 +685,18 @@ def create_app():
         file_upload.change(
             fn=upload_document,
             inputs=[file_upload, strategy_radio, lang_dropdown, active_jobs],
-            outputs=[upload_status, docs_list, active_jobs]
+            outputs=[upload_status, docs_list, active_jobs, refresh_timer],
+            concurrency_limit=1  # staging copies are disk-heavy
         )
         
         refresh_docs_btn.click(
-            fn=refresh_all_docs_ui,
+            fn=force_refresh_docs_ui,
+            inputs=[],
+            outputs=[docs_list, delete_dropdown]
+        )
+        
+        show_all_docs_btn.click(
+            fn=show_all_docs_ui,
             inputs=[],
             outputs=[docs_list, delete_dropdown]
         )
@@ -585,6 +710,7 @@ def create_app():
         # Initialize documents list on load
         demo.load(fn=refresh_all_docs_ui, inputs=[], outputs=[docs_list, delete_dropdown])
 
+    demo.queue(default_concurrency_limit=QUEUE_CONCURRENCY, max_size=QUEUE_MAX_SIZE)
     return demo, None
 
 if __name__ == "__main__":
@@ -1,3 +1,6 @@
+from functools import lru_cache
+from string import Formatter
+
 TRANSLATIONS = {
     "en": {
         "app_title": "AI Power Converter Designer",
@@ -49,6 +52,7 @@ TRANSLATIONS = {
         "docs_no_documents": "No documents uploaded yet.",
         "docs_delete_btn": "🗑️ Delete",
         "docs_refresh_btn": "🔄 Refresh",
+        "docs_show_all_btn": "📄 Show all",
         "docs_col_id": "ID",
         "docs_col_filename": "Filename",
         "docs_col_chunks": "Chunks",
@@ -176,6 +180,7 @@ TRANSLATIONS = {
         "docs_no_documents": "Aún no hay documentos subidos.",
         "docs_delete_btn": "🗑️ Eliminar",
         "docs_refresh_btn": "🔄 Actualizar",
+        "docs_show_all_btn": "📄 Mostrar todos",
         "docs_col_id": "ID",
         "docs_col_filename": "Nombre",
         "docs_col_chunks": "Fragmentos",
@@ -260,7 +265,30 @@ LANG_MAP = {
     "Español": "es"
 }
 
+@lru_cache(maxsize=4096)
 def get_text(key: str, lang_label: str = "Español") -> str:
-    """Get translated text for a key and language label."""
+    """Get translated text for a key and language label (memoized; TRANSLATIONS is static)."""
     lang_code = LANG_MAP.get(lang_label, "es")
     return TRANSLATIONS.get(lang_code, {}).get(key, key)
+
+
+@lru_cache(maxsize=256)
+def _compiled_template(key: str, lang_label: str):
+    """Parse a translated template once into (literal, field) pairs."""
+    template = get_text(key, lang_label)
+    parts = tuple(Formatter().parse(template))
+    # Format specs/conversions fall back to str.format_map
+    if any(spec or conv for _, _, spec, conv in parts):
+        return template, None
+    return template, tuple((literal, field) for literal, field, _, _ in parts)
+
+
+def format_text(key: str, lang_label: str = "Español", **params) -> str:
+    """Translated text with ``{name}`` placeholders filled from ``params``."""
+    template, parts = _compiled_template(key, lang_label)
+    if parts is None:
+        return template.format_map(params)
+    return "".join(
+        literal if field is None else literal + str(params[field])
+        for literal, field in parts
+    )
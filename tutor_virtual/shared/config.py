@@ -4,16 +4,11 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
 
-try:
-    from dotenv import load_dotenv
-    DOTENV_AVAILABLE = True
-except ImportError:
-    DOTENV_AVAILABLE = False
 
-
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CatalogConfig:
     """Configuration for component catalogs."""
     
@@ -32,7 +27,7 @@ class CatalogConfig:
     rate_limit_period: int = 60
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CacheConfig:
     """Configuration for Redis cache."""
     
@@ -43,7 +38,7 @@ class CacheConfig:
     redis_cache_ttl: int = 86400  # 24 hours
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RecommendationConfig:
     """Configuration for component recommendation."""
     
@@ -53,14 +48,14 @@ class RecommendationConfig:
     default_weight_thermal: float = 0.20
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RAGConfig:
     """Configuration for RAG service."""
     
     unstructured_timeout: int = 60
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """Application configuration."""
     
@@ -71,41 +66,96 @@ class AppConfig:
     
     @classmethod
     def from_env(cls, env_file: Optional[str] = None) -> AppConfig:
-        """Load configuration from environment variables."""
-        if DOTENV_AVAILABLE:
-            load_dotenv(env_file or ".env")
-        
-        catalog = CatalogConfig(
-            digikey_client_id=os.getenv("DIGIKEY_CLIENT_ID"),
-            digikey_client_secret=os.getenv("DIGIKEY_CLIENT_SECRET"),
-            mouser_api_key=os.getenv("MOUSER_API_KEY"),
-            lcsc_api_key=os.getenv("LCSC_API_KEY"),
-            rate_limit_requests=int(os.getenv("CATALOG_RATE_LIMIT_REQUESTS", "100")),
-            rate_limit_period=int(os.getenv("CATALOG_RATE_LIMIT_PERIOD", "60")),
-        )
+        """Load configuration from environment variables (re-parsed only when they change)."""
+        _load_dotenv(env_file or ".env")
         
-        cache = CacheConfig(
-            redis_host=os.getenv("REDIS_HOST", "localhost"),
-            redis_port=int(os.getenv("REDIS_PORT", "6379")),
-            redis_db=int(os.getenv("REDIS_DB", "0")),
-            redis_password=os.getenv("REDIS_PASSWORD"),
-            redis_cache_ttl=int(os.getenv("REDIS_CACHE_TTL", "86400")),
-        )
+        env = os.environ
+        fingerprint = tuple(env.get(var) for var in _TRACKED_ENV)
+        snapshot = _CONFIG_SNAPSHOTS.get(cls)
+        if snapshot is not None and snapshot.fingerprint == fingerprint:
+            return snapshot.config
         
-        recommendation = RecommendationConfig(
-            default_weight_cost=float(os.getenv("DEFAULT_WEIGHT_COST", "0.30")),
-            default_weight_availability=float(os.getenv("DEFAULT_WEIGHT_AVAILABILITY", "0.25")),
-            default_weight_efficiency=float(os.getenv("DEFAULT_WEIGHT_EFFICIENCY", "0.25")),
-            default_weight_thermal=float(os.getenv("DEFAULT_WEIGHT_THERMAL", "0.20")),
-        )
-        
-        rag = RAGConfig(
-            unstructured_timeout=int(os.getenv("UNSTRUCTURED_TIMEOUT", "60")),
-        )
-        
-        return cls(
-            catalog=catalog,
-            cache=cache,
-            recommendation=recommendation,
-            rag=rag
+        config = cls(
+            catalog=CatalogConfig(**_read_env(_CATALOG_ENV)),
+            cache=CacheConfig(**_read_env(_CACHE_ENV)),
+            recommendation=RecommendationConfig(**_read_env(_RECOMMENDATION_ENV)),
+            rag=RAGConfig(**_read_env(_RAG_ENV)),
         )
+        _CONFIG_SNAPSHOTS[cls] = _ConfigSnapshot(fingerprint, config)
+        return config
+
+
+@lru_cache(maxsize=None)
+def _load_dotenv(env_file: str) -> None:
+    # dotenv is optional and only needed here, not by every importer of the dataclasses.
+    # Each file is read once; it never overrides variables that are already set.
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    load_dotenv(env_file)
+
+
+class _ConfigSnapshot:
+    """Last config built by from_env and the tracked env values it was built from."""
+
+    __slots__ = ("fingerprint", "config")
+
+    def __init__(self, fingerprint: Tuple[Optional[str], ...], config: AppConfig):
+        self.fingerprint = fingerprint
+        self.config = config
+
+
+_CONFIG_SNAPSHOTS: Dict[type, _ConfigSnapshot] = {}
+
+
+# (field, environment variable, cast, default) for each config section
+_CATALOG_ENV = (
+    ("digikey_client_id", "DIGIKEY_CLIENT_ID", str, None),
+    ("digikey_client_secret", "DIGIKEY_CLIENT_SECRET", str, None),
+    ("mouser_api_key", "MOUSER_API_KEY", str, None),
+    ("lcsc_api_key", "LCSC_API_KEY", str, None),
+    ("rate_limit_requests", "CATALOG_RATE_LIMIT_REQUESTS", int, 100),
+    ("rate_limit_period", "CATALOG_RATE_LIMIT_PERIOD", int, 60),
+)
+
+_CACHE_ENV = (
+    ("redis_host", "REDIS_HOST", str, "localhost"),
+    ("redis_port", "REDIS_PORT", int, 6379),
+    ("redis_db", "REDIS_DB", int, 0),
+    ("redis_password", "REDIS_PASSWORD", str, None),
+    ("redis_cache_ttl", "REDIS_CACHE_TTL", int, 86400),
+)
+
+_RECOMMENDATION_ENV = (
+    ("default_weight_cost", "DEFAULT_WEIGHT_COST", float, 0.30),
+    ("default_weight_availability", "DEFAULT_WEIGHT_AVAILABILITY", float, 0.25),
+    ("default_weight_efficiency", "DEFAULT_WEIGHT_EFFICIENCY", float, 0.25),
+    ("default_weight_thermal", "DEFAULT_WEIGHT_THERMAL", float, 0.20),
+)
+
+_RAG_ENV = (
+    ("unstructured_timeout", "UNSTRUCTURED_TIMEOUT", int, 60),
+)
+
+
+# Every variable from_env depends on; a change in any of them triggers a rebuild
+_TRACKED_ENV = tuple(
+    var for spec in (_CATALOG_ENV, _CACHE_ENV, _RECOMMENDATION_ENV, _RAG_ENV) for _, var, _, _ in spec
+)
+
+
+def _read_env(spec: Tuple[Tuple[str, str, Callable[[str], Any], Any], ...]) -> Dict[str, Any]:
+    """Read and coerce one config section from os.environ."""
+    env = os.environ
+    values = {}
+    for name, var, cast, default in spec:
+        raw = env.get(var)
+        if raw is None:
+            values[name] = default
+            continue
+        try:
+            values[name] = cast(raw)
+        except ValueError as exc:
+            raise ValueError(f"Invalid value for {var}: {raw!r}") from exc
+    return values
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Dict, List, Mapping, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Sequence
 
 
 class ValidationSeverity(str, Enum):
@@ -16,6 +18,14 @@ class ValidationSeverity(str, Enum):
     INFO = "info"
 
 
+# Shared read-only default for the Mapping fields of the frozen DTOs below
+_EMPTY_MAPPING: Mapping = MappingProxyType({})
+
+
+def _empty_mapping() -> Mapping:
+    return _EMPTY_MAPPING
+
+
 @dataclass(slots=True)
 class ValidationIssue:
     """Represents a rule violation or advisory detected during validation."""
@@ -37,14 +47,14 @@ class DesignContext:
     metadata: Mapping[str, str] = field(default_factory=dict)
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class ConverterSpec:
     """Normalized specification and constraints provided by the user."""
 
     topology_id: str
     operating_conditions: Mapping[str, float]
-    constraints: Mapping[str, float] = field(default_factory=dict)
-    design_goals: Mapping[str, float | str] = field(default_factory=dict)
+    constraints: Mapping[str, float] = field(default_factory=_empty_mapping)
+    design_goals: Mapping[str, float | str] = field(default_factory=_empty_mapping)
     notes: Optional[str] = None
 
 
@@ -56,35 +66,35 @@ class DesignRequest:
     spec: ConverterSpec
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class PreDesignResult:
     """Primary component values and intermediate calculations."""
 
     primary_values: Dict[str, float]
     operating_mode: Optional[str] = None
-    assumptions: Mapping[str, str] = field(default_factory=dict)
+    assumptions: Mapping[str, str] = field(default_factory=_empty_mapping)
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class LossReport:
     """Aggregated losses and thermal metrics estimated by the designer."""
 
     totals: Dict[str, float]
-    per_element: Mapping[str, float] = field(default_factory=dict)
+    per_element: Mapping[str, float] = field(default_factory=_empty_mapping)
     temperature_rise: Optional[float] = None
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class DesignRecommendation:
     """Final recommendation delivered to the user."""
 
     summary: str
-    suggested_adjustments: Mapping[str, str] = field(default_factory=dict)
-    next_steps: List[str] = field(default_factory=list)
-    metadata: Mapping[str, str] = field(default_factory=dict)
+    suggested_adjustments: Mapping[str, str] = field(default_factory=_empty_mapping)
+    next_steps: Sequence[str] = ()
+    metadata: Mapping[str, str] = field(default_factory=_empty_mapping)
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class DesignSessionResult:
     """Outcome of the predesign workflow for a converter."""
 
@@ -93,5 +103,9 @@ class DesignSessionResult:
     predesign: PreDesignResult
     losses: LossReport
     recommendation: DesignRecommendation
-    issues: List[ValidationIssue] = field(default_factory=list)
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    issues: Sequence[ValidationIssue] = ()
+    created_at: int = field(default_factory=time.time_ns)  # epoch nanoseconds, UTC
+
+    @property
+    def created_at_iso(self) -> str:
+        return datetime.fromtimestamp(self.created_at / 1e9, tz=timezone.utc).isoformat()
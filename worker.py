@@ -3,17 +3,22 @@
 import os
 import sys
 import logging
+import random
 import time
 import shutil
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from tutor_virtual.infrastructure.task_queue import RedisTaskQueue
-from tutor_virtual.infrastructure.rag import get_rag_service
 from tutor_virtual.shared.config import AppConfig
 
+# Redis and the RAG stack are heavy imports; they are loaded on first use
+if TYPE_CHECKING:
+    from tutor_virtual.infrastructure.rag import RAGService
+    from tutor_virtual.infrastructure.task_queue import RedisTaskQueue
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -21,19 +26,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger("worker")
 
-def process_indexing_task(payload: dict, queue: RedisTaskQueue, job_id: str):
+POP_TIMEOUT = 30  # seconds a BLPOP waits for the next job
+MAX_BACKOFF = 30.0  # cap for the reconnect backoff, in seconds
+
+def process_indexing_task(payload: dict, queue: "RedisTaskQueue", job_id: str, rag_service: "RAGService"):
     """Execute document indexing logic."""
     file_path = payload.get("file_path")
     original_filename = payload.get("original_filename")
     
-    if not file_path or not os.path.exists(file_path):
+    # A missing staging file surfaces as a failed job from the RAG service; no extra stat here
+    if not file_path:
         queue.set_job_status(job_id, "failed", {"error": "File not found"})
         return
 
     try:
-        queue.set_job_status(job_id, "processing", {"progress": 10, "message": "Initializing RAG service..."})
-        rag_service = get_rag_service()
-        
         strategy = payload.get("strategy", "fast")
         queue.set_job_status(job_id, "processing", {"progress": 30, "message": f"Processing document ({strategy})..."})
         
@@ -45,50 +51,88 @@ def process_indexing_task(payload: dict, queue: RedisTaskQueue, job_id: str):
                 "progress": 100,
                 "result": result
             })
-            logger.info(f"Job {job_id} completed successfully")
+            logger.info("Job %s completed successfully", job_id)
             
             # Cleanup staging file
             try:
-                os.remove(file_path)
-            except Exception:
+                os.unlink(file_path)
+            except FileNotFoundError:
                 pass
+            except OSError as e:
+                logger.warning("Cleanup of %s failed: %s", file_path, e)
         else:
             queue.set_job_status(job_id, "failed", {"error": result.get("error")})
-            logger.error(f"Job {job_id} failed: {result.get('error')}")
+            logger.error("Job %s failed: %s", job_id, result.get("error"))
             
     except Exception as e:
-        logger.error(f"Unexpected error in job {job_id}: {e}")
+        logger.error("Unexpected error in job %s: %s", job_id, e)
         queue.set_job_status(job_id, "failed", {"error": str(e)})
 
+def _backoff_delay(attempts: int) -> float:
+    """Capped exponential backoff with jitter for consecutive loop failures."""
+    return min(MAX_BACKOFF, 0.5 * 2 ** attempts) + random.random() * 0.5
+
 def main():
     """Main worker loop."""
     AppConfig.from_env()
     
     try:
+        from tutor_virtual.infrastructure.task_queue import RedisTaskQueue
+        from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
         queue = RedisTaskQueue()
         logger.info("Worker started. Waiting for tasks...")
         
+        # Warm the RAG service before the first job; if that fails, retry when a job needs it
+        rag_service = None
+        try:
+            from tutor_virtual.infrastructure.rag import get_rag_service
+            rag_service = get_rag_service()
+        except Exception as e:
+            logger.error("Could not initialize RAG service at startup: %s", e)
+        
+        attempts = 0
         while True:
             try:
-                job = queue.pop_job(timeout=5)
+                job = queue.pop_job(timeout=POP_TIMEOUT)
                 if job:
                     job_id = job["job_id"]
                     task_type = job["type"]
-                    logger.info(f"Received job {job_id}: {task_type}")
+                    logger.info("Received job %s: %s", job_id, task_type)
                     
                     if task_type == "index_document":
-                        process_indexing_task(job["payload"], queue, job_id)
+                        if rag_service is None:
+                            # Startup warm-up failed; try again now that a job needs it
+                            try:
+                                from tutor_virtual.infrastructure.rag import get_rag_service
+                                rag_service = get_rag_service()
+                            except Exception as e:
+                                logger.error("Could not initialize RAG service: %s", e)
+                                queue.set_job_status(job_id, "failed", {"error": str(e)})
+                                continue
+                        process_indexing_task(job["payload"], queue, job_id, rag_service)
                     else:
-                        logger.warning(f"Unknown task type: {task_type}")
+                        logger.warning("Unknown task type: %s", task_type)
+                # Only a clean iteration resets the backoff
+                attempts = 0
                         
+            except (RedisConnectionError, RedisTimeoutError) as e:
+                # Redis is flapping: back off exponentially (with jitter) instead of hammering it
+                delay = _backoff_delay(attempts)
+                attempts += 1
+                logger.error("Redis unavailable (%s); retrying in %.1fs", e, delay)
+                time.sleep(delay)
             except Exception as e:
-                logger.error(f"Error in worker loop: {e}")
-                time.sleep(5)
+                # Job failures are handled inside process_indexing_task; anything reaching here
+                # (ResponseError on BLPOP, malformed job dict) can repeat, so back off as well
+                delay = _backoff_delay(attempts)
+                attempts += 1
+                logger.error("Error in worker loop (%s); retrying in %.1fs", e, delay)
+                time.sleep(delay)
                 
     except KeyboardInterrupt:
         logger.info("Worker stopping...")
     except Exception as e:
-        logger.critical(f"Worker crashed: {e}")
+        logger.critical("Worker crashed: %s", e)
 
 if __name__ == "__main__":
     main()